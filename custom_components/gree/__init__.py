@@ -17,33 +17,53 @@ from homeassistant.const import (
     CONF_PORT,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.typing import ConfigType
 
 # Local imports
 from .const import (
+    CONF_COMMAND_COALESCE_WINDOW,
+    CONF_HEDGE_REQUESTS,
+    CONF_DEVICES,
     CONF_DISABLE_AVAILABLE_CHECK,
     CONF_ENCRYPTION_KEY,
     CONF_ENCRYPTION_VERSION,
     CONF_FAN_MODES,
+    CONF_HUB,
     CONF_HVAC_MODES,
+    CONF_MAX_REQUESTS_IN_FLIGHT,
+    CONF_MAX_REQUESTS_PER_HOST,
     CONF_SWING_HORIZONTAL_MODES,
     CONF_SWING_MODES,
     CONF_TEMP_SENSOR_OFFSET,
     CONF_UID,
+    DEFAULT_COMMAND_COALESCE_WINDOW,
     DEFAULT_FAN_MODES,
     DEFAULT_HVAC_MODES,
+    DEFAULT_MAX_REQUESTS_IN_FLIGHT,
+    DEFAULT_MAX_REQUESTS_PER_HOST,
     DEFAULT_PORT,
     DEFAULT_SWING_HORIZONTAL_MODES,
     DEFAULT_SWING_MODES,
     DOMAIN,
+    MAX_COMMAND_COALESCE_WINDOW,
     OPTION_KEYS,
+    REQUEST_LIMIT_OPTION_KEYS,
+    YAML_IMPORT_CONCURRENCY,
 )
+from .entity import async_add_entities_for_device
+from .gree_protocol import configure_request_limits, normalize_mac
+from .helpers import async_get_device_state_store, async_run_import_flows
 
 PLATFORMS = [Platform.CLIMATE, Platform.SWITCH, Platform.NUMBER, Platform.SELECT, Platform.SENSOR]
 _LOGGER = logging.getLogger(__name__)
 
+# Changing any of these needs a new device session; everything else is applied live.
+# The HVAC modes decide which mode-specific switches exist, so they need new entities too.
+RELOAD_KEYS = (CONF_NAME, CONF_HOST, CONF_PORT, CONF_MAC, CONF_ENCRYPTION_KEY, CONF_ENCRYPTION_VERSION, CONF_UID, CONF_HVAC_MODES)
+
 # YAML configuration schema
 CLIMATE_SCHEMA = vol.Schema(
     {
@@ -60,6 +80,8 @@ CLIMATE_SCHEMA = vol.Schema(
         vol.Optional(CONF_SWING_HORIZONTAL_MODES, default=DEFAULT_SWING_HORIZONTAL_MODES): vol.All(cv.ensure_list, [cv.string]),
         vol.Optional(CONF_DISABLE_AVAILABLE_CHECK, default=False): cv.boolean,
         vol.Optional(CONF_TEMP_SENSOR_OFFSET): cv.boolean,
+        vol.Optional(CONF_COMMAND_COALESCE_WINDOW, default=DEFAULT_COMMAND_COALESCE_WINDOW): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_COMMAND_COALESCE_WINDOW)),
+        vol.Optional(CONF_HEDGE_REQUESTS, default=False): cv.boolean,
     }
 )
 
@@ -71,14 +93,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if DOMAIN not in config:
         return True
 
-    for climate_config in config[DOMAIN]:
-        hass.async_create_task(
-            hass.config_entries.flow.async_init(
-                DOMAIN,
-                context={"source": "import"},
-                data=climate_config,
-            )
-        )
+    # Units already set up with a stored key need no import flow at all
+    configured = {normalize_mac(entry.unique_id) for entry in hass.config_entries.async_entries(DOMAIN) if entry.unique_id and entry.data.get(CONF_ENCRYPTION_KEY)}
+    configured.update(
+        normalize_mac(device_config[CONF_MAC])
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.data.get(CONF_HUB)
+        for device_config in entry.data[CONF_DEVICES]
+        if device_config.get(CONF_ENCRYPTION_KEY)
+    )
+    pending = [climate_config for climate_config in config[DOMAIN] if normalize_mac(climate_config[CONF_MAC]) not in configured]
+    _LOGGER.debug("Importing %s of %s YAML devices", len(pending), len(config[DOMAIN]))
+    if pending:
+        # Through a few workers, so a large YAML file doesn't bind every unit at once
+        hass.async_create_background_task(async_run_import_flows(hass, pending, YAML_IMPORT_CONCURRENCY), f"{DOMAIN} YAML import")
 
     return True
 
@@ -88,16 +116,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    # Combine entry data with options
-    combined_data = {**entry.data}
-    for key, value in entry.options.items():
-        if key not in OPTION_KEYS:
-            _LOGGER.debug("Ignoring unexpected option key %s", key)
-            continue
-        if value is None:
-            combined_data.pop(key, None)
-        else:
-            combined_data[key] = value
+    if entry.data.get(CONF_HUB):
+        return await _async_setup_hub_entry(hass, entry)
+
+    combined_data = _combined_config(entry)
 
     # Create the Gree device instance here and store it
     from .climate import create_gree_device
@@ -108,25 +130,173 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = {
         "config": combined_data,
         "device": device,
+        "devices": {combined_data[CONF_MAC]: device},
+        # Filled by the platforms, see entity.async_setup_device_entities
+        "entity_factories": [],
+        "entities": {},
     }
 
+    _apply_request_limits(hass)
+
     _LOGGER.debug("Setting up config entry %s with data: %s", entry.entry_id, combined_data)
     entry.async_on_unload(entry.add_update_listener(_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_setup_hub_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up a hub entry, which manages all of its devices with one set of platforms."""
+    from .climate import create_gree_device
+
+    device_configs = {device_config[CONF_MAC]: device_config for device_config in entry.data[CONF_DEVICES]}
+    hass.data[DOMAIN][entry.entry_id] = {
+        "config": {**entry.data},
+        "device_configs": device_configs,
+        "devices": {mac: await create_gree_device(hass, device_config) for mac, device_config in device_configs.items()},
+        "entity_factories": [],
+        "entities": {},
+    }
+    _apply_request_limits(hass)
+
+    _LOGGER.debug("Setting up hub entry %s with %s devices", entry.entry_id, len(device_configs))
+    entry.async_on_unload(entry.add_update_listener(_hub_update_listener))
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+@callback
+def _apply_request_limits(hass: HomeAssistant) -> None:
+    """Apply the request limits set in the options of the loaded entries; they are shared by the whole integration."""
+    limits = {CONF_MAX_REQUESTS_IN_FLIGHT: DEFAULT_MAX_REQUESTS_IN_FLIGHT, CONF_MAX_REQUESTS_PER_HOST: DEFAULT_MAX_REQUESTS_PER_HOST}
+    configured = {key: [] for key in limits}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.entry_id not in hass.data.get(DOMAIN, {}):
+            continue
+        for key in REQUEST_LIMIT_OPTION_KEYS:
+            if entry.options.get(key) is not None:
+                configured[key].append(entry.options[key])
+    # When several entries set a limit, the strictest one is honoured
+    limits.update({key: min(values) for key, values in configured.items() if values})
+    configure_request_limits(hass, max_in_flight=limits[CONF_MAX_REQUESTS_IN_FLIGHT], max_per_host=limits[CONF_MAX_REQUESTS_PER_HOST])
+
+
+def _combined_config(entry: ConfigEntry) -> dict:
+    """Combine entry data with options."""
+    combined_data = {**entry.data}
+    for key, value in entry.options.items():
+        if key in REQUEST_LIMIT_OPTION_KEYS:
+            # Not a device setting, see _apply_request_limits
+            continue
+        if key not in OPTION_KEYS:
+            _LOGGER.debug("Ignoring unexpected option key %s", key)
+            continue
+        if value is None:
+            combined_data.pop(key, None)
+        else:
+            combined_data[key] = value
+    return combined_data
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
         _LOGGER.debug("Unloaded config entry %s", entry.entry_id)
         hass.data[DOMAIN].pop(entry.entry_id)
+        if any(not key.startswith("_") for key in hass.data[DOMAIN]):
+            # Limits this entry set no longer apply; back to the defaults unless another entry sets them
+            _apply_request_limits(hass)
+        else:
+            # Last entry gone: start over with default limits, fresh schedulers and no cached keys
+            hass.data[DOMAIN].pop("_transport", None)
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the saved state of the devices of a removed entry."""
+    from .climate import device_unique_id
+
+    device_configs = entry.data[CONF_DEVICES] if entry.data.get(CONF_HUB) else [entry.data]
+    state_store = await async_get_device_state_store(hass)
+    for device_config in device_configs:
+        state_store.async_remove(device_unique_id(device_config[CONF_MAC]))
+
+
+async def _hub_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply a changed hub entry, touching only the devices that changed."""
+    from .climate import create_gree_device
+
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        return
+    _apply_request_limits(hass)
+
+    old_configs = entry_data["device_configs"]
+    new_configs = {device_config[CONF_MAC]: device_config for device_config in entry.data[CONF_DEVICES]}
+    for mac in old_configs.keys() - new_configs.keys():
+        _LOGGER.debug("Removing device %s from hub entry %s", mac, entry.entry_id)
+        await _async_remove_hub_device(hass, entry, entry_data, mac, forget=True)
+
+    for mac, device_config in new_configs.items():
+        old_config = old_configs.get(mac)
+        if old_config == device_config:
+            continue
+        if old_config is not None and all(old_config.get(key) == device_config.get(key) for key in RELOAD_KEYS):
+            # Keep the device session and apply the options in place
+            entry_data["devices"][mac].async_apply_config(device_config)
+            old_configs[mac] = device_config
+            continue
+        if old_config is not None:
+            _LOGGER.debug("Recreating device %s of hub entry %s after a connection change", mac, entry.entry_id)
+            await _async_remove_hub_device(hass, entry, entry_data, mac, forget=False)
+        else:
+            _LOGGER.debug("Adding device %s to hub entry %s", mac, entry.entry_id)
+        device = await create_gree_device(hass, device_config)
+        entry_data["devices"][mac] = device
+        old_configs[mac] = device_config
+        async_add_entities_for_device(entry_data, device)
+
+
+async def _async_remove_hub_device(hass: HomeAssistant, entry: ConfigEntry, entry_data: dict, mac: str, forget: bool) -> None:
+    """Remove the entities of one hub device; with forget, also detach it from the device registry."""
+    device = entry_data["devices"].pop(mac)
+    entry_data["device_configs"].pop(mac)
+    for entity in entry_data["entities"].pop(device, []):
+        await entity.async_remove()
+    if forget:
+        (await async_get_device_state_store(hass)).async_remove(device._unique_id)
+        device_registry = dr.async_get(hass)
+        device_entry = device_registry.async_get_device(identifiers={(DOMAIN, device._mac_addr)})
+        if device_entry is not None:
+            device_registry.async_update_device(device_entry.id, remove_config_entry_id=entry.entry_id)
+
+
+async def async_remove_config_entry_device(hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry) -> bool:
+    """Allow removing a device of a hub entry from the UI; single-device entries are removed as a whole."""
+    if not entry.data.get(CONF_HUB):
+        return False
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    removed = {mac for mac, device in entry_data.get("devices", {}).items() if (DOMAIN, device._mac_addr) in device_entry.identifiers}
+    if removed:
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_DEVICES: [device_config for device_config in entry.data[CONF_DEVICES] if device_config[CONF_MAC] not in removed]},
+        )
+    return True
+
+
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     _LOGGER.debug("Options updated for entry %s: %s", entry.entry_id, entry.options)
-    _LOGGER.debug("Reloading config entry %s after options update", entry.entry_id)
-    await hass.config_entries.async_reload(entry.entry_id)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    combined_data = _combined_config(entry)
+    if entry_data is None or any(combined_data.get(key) != entry_data["config"].get(key) for key in RELOAD_KEYS):
+        _LOGGER.debug("Reloading config entry %s after options update", entry.entry_id)
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Keep the device session (key, probed capabilities, state) and apply the options in place
+    _LOGGER.debug("Applying options to running device of entry %s", entry.entry_id)
+    _apply_request_limits(hass)
+    entry_data["config"] = combined_data
+    entry_data["device"].async_apply_config(combined_data)
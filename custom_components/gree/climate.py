@@ -5,9 +5,11 @@ This module defines the climate (HVAC) unit for the Gree integration.
 """
 
 # Standard library imports
+import asyncio
 import base64
 import logging
-from datetime import timedelta
+import random
+from collections import Counter
 
 # Third-party imports
 try:
@@ -26,7 +28,10 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_PORT,
 )
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 
 # Local imports
 from .const import (
@@ -37,11 +42,22 @@ from .const import (
     DEFAULT_SWING_MODES,
     DEFAULT_SWING_HORIZONTAL_MODES,
     DEFAULT_TARGET_TEMP_STEP,
+    FIRST_SYNC_COMMAND_WAIT,
     MIN_TEMP_C,
     MIN_TEMP_F,
     MAX_TEMP_C,
     MAX_TEMP_F,
     MODES_MAPPING,
+    CLIMATE_STATUS_COLUMNS,
+    COMMAND_COMPANION_OPTIONS,
+    HOT_STATUS_COLUMNS,
+    POLL_FULL_REFRESH_CYCLES,
+    POLL_INTERVAL_FAST,
+    REQUEST_BUDGET_BIND,
+    REQUEST_BUDGET_COMMAND,
+    REQUEST_BUDGET_POLL,
+    SENSOR_STATUS_COLUMNS,
+    STATUS_COLUMNS,
     TEMSEN_OFFSET,
     CONF_HVAC_MODES,
     CONF_FAN_MODES,
@@ -52,9 +68,24 @@ from .const import (
     CONF_ENCRYPTION_VERSION,
     CONF_DISABLE_AVAILABLE_CHECK,
     CONF_TEMP_SENSOR_OFFSET,
+    CONF_COMMAND_COALESCE_WINDOW,
+    CONF_HEDGE_REQUESTS,
+    DEFAULT_COMMAND_COALESCE_WINDOW,
 )
-from .gree_protocol import Pad, FetchResult, GetDeviceKey, GetGCMCipher, EncryptGCM, GetDeviceKeyGCM
-from .helpers import TempOffsetResolver, gree_f_to_c, gree_c_to_f, encode_temp_c, decode_temp_c
+from .entity import async_setup_device_entities
+from .gree_protocol import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    EncryptGCM,
+    FetchResult,
+    GetGCMCipher,
+    GreeRequestNotSent,
+    GreeRequestPreempted,
+    Pad,
+    async_get_bind_key,
+    forget_bind_key,
+)
+from .helpers import AdaptivePollPolicy, CommandCoalescer, DeviceState, SingleFlight, TempOffsetResolver, async_get_device_state_store, get_startup_scheduler, gree_f_to_c, gree_c_to_f, encode_temp_c, decode_temp_c
 
 REQUIREMENTS = ["pycryptodome"]
 
@@ -62,6 +93,50 @@ _LOGGER = logging.getLogger(__name__)
 
 SUPPORT_FLAGS = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
 
+# Probed capability flags and the status column each one adds to the poll
+CAPABILITY_COLUMNS = {
+    "_has_temp_sensor": "TemSen",
+    "_has_anti_direct_blow": "AntiDirectBlow",
+    "_has_light_sensor": "LigSen",
+    "_has_outside_temp_sensor": "OutEnvTem",
+    "_has_room_humidity_sensor": "DwatSen",
+}
+# Decoded attributes saved with the status columns, so the UI is right before the first poll
+RESTORED_ATTRIBUTES = (
+    "_target_temperature",
+    "_hvac_mode",
+    "_fan_mode",
+    "_swing_mode",
+    "_swing_horizontal_mode",
+    "_current_temperature",
+    "_current_outside_temperature",
+    "_current_room_humidity",
+)
+
+
+def _live_options(config):
+    """Parse the options that can be applied to a running device."""
+    chm = config.get(CONF_HVAC_MODES)
+    cfm = config.get(CONF_FAN_MODES)
+    csm = config.get(CONF_SWING_MODES)
+    cshm = config.get(CONF_SWING_HORIZONTAL_MODES)
+    return {
+        "hvac_modes": [getattr(HVACMode, mode.upper()) for mode in (chm if chm is not None else DEFAULT_HVAC_MODES)],
+        "fan_modes": cfm if cfm is not None else DEFAULT_FAN_MODES,
+        "swing_modes": csm if csm is not None else DEFAULT_SWING_MODES,
+        "swing_horizontal_modes": cshm if cshm is not None else DEFAULT_SWING_HORIZONTAL_MODES,
+        "disable_available_check": config.get(CONF_DISABLE_AVAILABLE_CHECK, False),
+        "temp_sensor_offset": config.get(CONF_TEMP_SENSOR_OFFSET),
+        "command_coalesce_window": config.get(CONF_COMMAND_COALESCE_WINDOW, DEFAULT_COMMAND_COALESCE_WINDOW),
+        "hedge_requests": config.get(CONF_HEDGE_REQUESTS, False),
+    }
+
+
+def device_unique_id(mac_addr):
+    """Return the unique ID of the device configured with mac_addr, without creating it."""
+    mac_addr = mac_addr.replace(":", "").lower()
+    return f"{DOMAIN}_{mac_addr.split('@', 1)[0]}"
+
 
 async def create_gree_device(hass, config):
     """Create a Gree device instance from config."""
@@ -70,20 +145,11 @@ async def create_gree_device(hass, config):
     port = config.get(CONF_PORT, DEFAULT_PORT)
     mac_addr = config.get(CONF_MAC).encode().replace(b":", b"")
 
-    chm = config.get(CONF_HVAC_MODES)
-    hvac_modes = [getattr(HVACMode, mode.upper()) for mode in (chm if chm is not None else DEFAULT_HVAC_MODES)]
-
-    cfm = config.get(CONF_FAN_MODES)
-    fan_modes = cfm if cfm is not None else DEFAULT_FAN_MODES
-    csm = config.get(CONF_SWING_MODES)
-    swing_modes = csm if csm is not None else DEFAULT_SWING_MODES
-    cshm = config.get(CONF_SWING_HORIZONTAL_MODES)
-    swing_horizontal_modes = cshm if cshm is not None else DEFAULT_SWING_HORIZONTAL_MODES
+    options = _live_options(config)
     encryption_key = config.get(CONF_ENCRYPTION_KEY)
     uid = config.get(CONF_UID)
     encryption_version = config.get(CONF_ENCRYPTION_VERSION, 1)
-    disable_available_check = config.get(CONF_DISABLE_AVAILABLE_CHECK, False)
-    temp_sensor_offset = config.get(CONF_TEMP_SENSOR_OFFSET)
+    state_store = await async_get_device_state_store(hass)
 
     return GreeClimate(
         hass,
@@ -91,31 +157,25 @@ async def create_gree_device(hass, config):
         ip_addr,
         port,
         mac_addr,
-        hvac_modes,
-        fan_modes,
-        swing_modes,
-        swing_horizontal_modes,
+        options["hvac_modes"],
+        options["fan_modes"],
+        options["swing_modes"],
+        options["swing_horizontal_modes"],
         encryption_version,
-        disable_available_check,
+        options["disable_available_check"],
         encryption_key,
         uid,
-        temp_sensor_offset,
+        options["temp_sensor_offset"],
+        options["command_coalesce_window"],
+        state_store,
+        hedge_requests=options["hedge_requests"],
     )
 
 
-# from the remote control and gree app
-
-# update() interval
-SCAN_INTERVAL = timedelta(seconds=60)
-
-
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up Gree climate from a config entry."""
-    # Get the device that was created in __init__.py
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    device = entry_data["device"]
-
-    async_add_devices([device])
+    # The devices were created in __init__.py, and are their own climate entity
+    async_setup_device_entities(hass, entry, async_add_devices, lambda device: [device])
 
 
 async def async_unload_entry(hass, entry):
@@ -123,6 +183,100 @@ async def async_unload_entry(hass, entry):
     return True
 
 
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StatusDecoder:
+    """
+    Decode a device's status columns into climate attributes in one pass.
+
+    Built once per device: MODES_MAPPING is inverted into value -> mode
+    tables, and in °F the display value of every target and sensor
+    temperature in the device's range is computed up front.
+    """
+
+    HVAC_MODES = {value: mode for mode, value in MODES_MAPPING["Mod"].items()}
+    FAN_MODES = {value: mode for mode, value in MODES_MAPPING["WdSpd"].items()}
+    SWING_MODES = {value: mode for mode, value in MODES_MAPPING["SwUpDn"].items()}
+    SWING_HORIZONTAL_MODES = {value: mode for mode, value in MODES_MAPPING["SwingLfRig"].items()}
+
+    def __init__(self, name, unit_of_measurement, temp_sensor_offset, process_temp_sensor):
+        self._name = name
+        self._fahrenheit = unit_of_measurement == "°F"
+        self._temp_sensor_offset = temp_sensor_offset
+        self._process_temp_sensor = process_temp_sensor
+
+        if unit_of_measurement not in ("°C", "°F"):
+            _LOGGER.error(f"{name}: Unknown unit of measurement: {unit_of_measurement}, using °C")
+
+        self._target_f = {}
+        self._sensor_f = {}
+        if self._fahrenheit:
+            # 8°C heating up to the maximum set point, and every plausible sensor reading
+            self._target_f = {(set_tem, tem_rec): gree_c_to_f(SetTem=set_tem, TemRec=tem_rec) for set_tem in range(8, MAX_TEMP_C + 1) for tem_rec in (0, 1)}
+            self._sensor_f = {temp_c: gree_c_to_f(SetTem=temp_c, TemRec=0) for temp_c in range(-40, 81)}
+
+    def sensor_temperature(self, raw):
+        if self._temp_sensor_offset is None:
+            # User hasn't chosen an offset, determine it from the readings seen so far
+            temp_c = self._process_temp_sensor(raw)
+        elif self._temp_sensor_offset is True:
+            temp_c = raw - TEMSEN_OFFSET
+        else:
+            temp_c = raw
+        if not self._fahrenheit:
+            return temp_c
+        temp_f = self._sensor_f.get(temp_c)
+        return temp_f if temp_f is not None else gree_c_to_f(SetTem=temp_c, TemRec=0)
+
+    def decode(self, state, device):
+        """Write the climate attributes for state onto device."""
+        # If 8℃ heating is active we show 8℃, the same as the AC display
+        if _as_int(state["StHt"]) == 1:
+            device._target_temperature = 8
+        elif state["SetTem"] is not None:
+            set_tem, tem_rec = _as_int(state["SetTem"]), _as_int(state["TemRec"])
+            if self._fahrenheit:
+                target = self._target_f.get((set_tem, tem_rec))
+                device._target_temperature = target if target is not None else gree_c_to_f(SetTem=set_tem, TemRec=tem_rec)
+            else:
+                device._target_temperature = decode_temp_c(SetTem=set_tem, TemRec=tem_rec)  # takes care of 1/2 degrees
+
+        if state["Pow"] == 0:
+            device._hvac_mode = HVACMode.OFF
+        else:
+            device._hvac_mode = self.HVAC_MODES.get(_as_int(state["Mod"]), device._hvac_mode)
+
+        device._swing_mode = self.SWING_MODES.get(_as_int(state["SwUpDn"]), device._swing_mode)
+        device._swing_horizontal_mode = self.SWING_HORIZONTAL_MODES.get(_as_int(state["SwingLfRig"]), device._swing_horizontal_mode)
+
+        if _as_int(state["Tur"]) == 1:
+            device._fan_mode = "turbo"
+        elif (_as_int(state["Quiet"]) or 0) >= 1:
+            device._fan_mode = "quiet"
+        else:
+            device._fan_mode = self.FAN_MODES.get(_as_int(state["WdSpd"]), device._fan_mode)
+
+        if device._has_temp_sensor and state["TemSen"] is not None:
+            device._current_temperature = self.sensor_temperature(state["TemSen"])
+        if device._has_outside_temp_sensor and state["OutEnvTem"] is not None:
+            device._current_outside_temperature = self.sensor_temperature(state["OutEnvTem"])
+        if device._has_room_humidity_sensor:
+            device._current_room_humidity = state["DwatSen"]
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"{self._name}: Decoded state: hvac_mode={device._hvac_mode}, target_temperature={device._target_temperature}, "
+                f"fan_mode={device._fan_mode}, swing_mode={device._swing_mode}, swing_horizontal_mode={device._swing_horizontal_mode}, "
+                f"current_temperature={device._current_temperature}, outside_temperature={device._current_outside_temperature}, "
+                f"room_humidity={device._current_room_humidity}"
+            )
+
+
 class GreeClimate(ClimateEntity):
     # Language is retrieved from translation key
     _attr_translation_key = "gree"
@@ -143,6 +297,9 @@ class GreeClimate(ClimateEntity):
         encryption_key=None,
         uid=None,
         temp_sensor_offset=None,
+        command_coalesce_window=DEFAULT_COMMAND_COALESCE_WINDOW,
+        state_store=None,
+        hedge_requests=False,
     ):
         _LOGGER.info(f"{name}: Initializing Gree climate device")
 
@@ -179,6 +336,8 @@ class GreeClimate(ClimateEntity):
 
         # Store for external temp sensor entity (set by sensor entity)
         self._external_temperature_sensor = None
+        # Last reading of the external sensor in HA units, kept current by a state listener
+        self._external_temperature = None
 
         # Keep unsub callbacks for deregistering listeners
         self._listeners: list = []
@@ -212,33 +371,15 @@ class GreeClimate(ClimateEntity):
                 _LOGGER.error(f"{self._name}: Encryption version {self.encryption_version} is not implemented")
         else:
             self._encryption_key = None
+        # Whether the key came from a bind rather than the configuration
+        self._bound_key = False
 
         if uid:
             self._uid = uid
         else:
             self._uid = 0
 
-        self._acOptions = {
-            "Pow": None,
-            "Mod": None,
-            "SetTem": None,
-            "WdSpd": None,
-            "Air": None,
-            "Blo": None,
-            "Health": None,
-            "SwhSlp": None,
-            "Lig": None,
-            "SwingLfRig": None,
-            "SwUpDn": None,
-            "Quiet": None,
-            "Tur": None,
-            "StHt": None,
-            "TemUn": None,
-            "HeatCoolType": None,
-            "TemRec": None,
-            "SvSt": None,
-            "SlpMod": None,
-        }
+        self._acOptions = DeviceState()
         self._optionsToFetch = ["Pow", "Mod", "SetTem", "WdSpd", "Air", "Blo", "Health", "SwhSlp", "Lig", "SwingLfRig", "SwUpDn", "Quiet", "Tur", "StHt", "TemUn", "HeatCoolType", "TemRec", "SvSt", "SlpMod"]
 
         # Initialize auto switches
@@ -251,7 +392,104 @@ class GreeClimate(ClimateEntity):
         # helper method to determine TemSen offset
         self._process_temp_sensor = TempOffsetResolver()
 
-    async def GreeGetValues(self, propertyNames):
+        # Turns polled status columns into HA attributes
+        self._status_decoder = StatusDecoder(name, self._unit_of_measurement, temp_sensor_offset, self._process_temp_sensor)
+
+        # Resend unanswered requests early on lossy links
+        self._hedge_requests = hedge_requests
+
+        # Commands fired within this window are sent to the device as one packet
+        self._command_coalescer = CommandCoalescer(hass, command_coalesce_window / 1000, self._async_sync_state)
+
+        # Status reads are shared between concurrent callers; updates to device state are serialized
+        self._status_reads = SingleFlight()
+        self._state_lock = asyncio.Lock()
+        # Bumped whenever a command is sent, so older status reads can be recognised as stale
+        self._state_version = 0
+
+        # Status polling is scheduled by the entity itself, at a rate that follows device activity
+        self._poll_policy = AdaptivePollPolicy()
+        self._poll_enabled = False
+        self._poll_unsub = None
+        self._first_sync_task = None
+
+        # Configuration columns are only read on every Nth poll or after an outside change
+        self._poll_cycle = 0
+        self._full_refresh_due = True
+
+        # Status columns read by the enabled entities of this device; nothing else is polled
+        self._consumed_columns: Counter = Counter()
+        # (columns, update callback) per entity, to write HA state only when its columns change
+        self._state_listeners: list = []
+
+        # Start from the last confirmed state; the first poll only reconciles differences
+        self._state_store = state_store
+        if state_store is not None:
+            self._restore_state(state_store.get(self._unique_id))
+
+    def _restore_state(self, saved):
+        if not saved:
+            return
+        self._acOptions.update({column: value for column, value in saved.get("options", {}).items() if column in STATUS_COLUMNS})
+        for flag, column in CAPABILITY_COLUMNS.items():
+            value = saved.get("capabilities", {}).get(flag)
+            if value is None:
+                continue
+            setattr(self, flag, value)
+            if value and column not in self._optionsToFetch:
+                self._optionsToFetch.append(column)
+        for attribute, value in saved.get("attributes", {}).items():
+            if attribute in RESTORED_ATTRIBUTES:
+                setattr(self, attribute, value)
+        if self._hvac_mode is not None:
+            self._hvac_mode = HVACMode(self._hvac_mode)
+        # Shown as it was until the first poll says otherwise
+        self._device_online = True
+        _LOGGER.debug(f"{self._name}: Restored last known state: {saved}")
+
+    @callback
+    def _async_save_state(self):
+        if self._state_store is None:
+            return
+        self._state_store.async_save(
+            self._unique_id,
+            {
+                "options": {column: value for column, value in self._acOptions.items() if value is not None},
+                "capabilities": {flag: getattr(self, flag) for flag in CAPABILITY_COLUMNS},
+                "attributes": {attribute: getattr(self, attribute) for attribute in RESTORED_ATTRIBUTES},
+            },
+        )
+
+    @callback
+    def async_apply_config(self, config):
+        """Apply changed options to the running device, keeping its key, capabilities and state."""
+        options = _live_options(config)
+        self._hvac_modes = options["hvac_modes"]
+        self._fan_modes = options["fan_modes"]
+        self._swing_modes = options["swing_modes"]
+        self._swing_horizontal_modes = options["swing_horizontal_modes"]
+        self._disable_available_check = options["disable_available_check"]
+        if options["temp_sensor_offset"] != self._temp_sensor_offset:
+            self._temp_sensor_offset = options["temp_sensor_offset"]
+            # The resolver keeps what it learned, it's only consulted when no offset is configured
+            self._status_decoder = StatusDecoder(self._name, self._unit_of_measurement, self._temp_sensor_offset, self._process_temp_sensor)
+        self._command_coalescer.window = options["command_coalesce_window"] / 1000
+        self._hedge_requests = options["hedge_requests"]
+        _LOGGER.info(f"{self._name}: Applied updated options")
+
+        if not self._firstTimeRun:
+            self.UpdateHAStateToCurrentACState()
+        # Mode lists and availability can change for every entity of the device
+        self._async_notify_state_changes(set(STATUS_COLUMNS), True)
+
+    async def GreeGetValues(self, propertyNames, priority=PRIORITY_BACKGROUND):
+        # Concurrent reads of the same columns share one request. Reads started
+        # after a command never join one that may predate it, and commands never
+        # join a background read that could be preempted.
+        key = (self._state_version, priority, tuple(propertyNames))
+        return await self._status_reads.async_run(key, lambda: self._async_fetch_values(list(propertyNames), priority))
+
+    async def _async_fetch_values(self, propertyNames, priority):
         plaintext = '{"cols":' + simplejson.dumps(propertyNames) + ',"mac":"' + str(self._sub_mac_addr) + '","t":"status"}'
         if self.encryption_version == 1:
             cipher = self.CIPHER
@@ -260,40 +498,86 @@ class GreeClimate(ClimateEntity):
             pack, tag = EncryptGCM(self._encryption_key, plaintext)
             jsonPayloadToSend = '{"cid":"app","i":0,"pack":"' + pack + '","t":"pack","tcid":"' + str(self._mac_addr) + '","uid":{}'.format(self._uid) + ',"tag" : "' + tag + '"}'
             cipher = GetGCMCipher(self._encryption_key)
-        result = await FetchResult(cipher, self._ip_addr, self._port, jsonPayloadToSend, encryption_version=self.encryption_version)
+        result = await FetchResult(self.hass, cipher, self._ip_addr, self._port, jsonPayloadToSend, encryption_version=self.encryption_version, budget=REQUEST_BUDGET_COMMAND if priority == PRIORITY_INTERACTIVE else REQUEST_BUDGET_POLL, priority=priority, hedge=self._hedge_requests)
         return result["dat"][0] if len(result["dat"]) == 1 else result["dat"]
 
     def SetAcOptions(self, acOptions, newOptionsToOverride, optionValuesToOverride=None):
+        """Store new option values and return the options whose value changed."""
         if optionValuesToOverride is not None:
-            # Build a list of key-value pairs for a single log line
-            settings = []
-            for key in newOptionsToOverride:
-                value = optionValuesToOverride[newOptionsToOverride.index(key)]
-                settings.append(f"{key}={value}")
-                acOptions[key] = value
-            _LOGGER.debug(f"{self._name}: Setting device options with retrieved values: {', '.join(settings)}")
+            changed = acOptions.apply(newOptionsToOverride, optionValuesToOverride)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                settings = ", ".join(f"{key}={value}" for key, value in zip(newOptionsToOverride, optionValuesToOverride))
+                _LOGGER.debug(f"{self._name}: Setting device options with retrieved values: {settings}")
         else:
-            # Build a list of key-value pairs for a single log line
-            settings = []
-            for key, value in newOptionsToOverride.items():
-                settings.append(f"{key}={value}")
-                acOptions[key] = value
-            _LOGGER.debug(f"{self._name}: Overwriting device options with new settings: {', '.join(settings)}")
-        return acOptions
-
-    async def SendStateToAc(self):
-        opt_list = ["Pow", "Mod", "SetTem", "WdSpd", "Air", "Blo", "Health", "SwhSlp", "Lig", "SwingLfRig", "SwUpDn", "Quiet", "Tur", "StHt", "TemUn", "HeatCoolType", "TemRec", "SvSt", "SlpMod", "AntiDirectBlow", "LigSen"]
-
-        # Collect values from _acOptions
-        p_values = [self._acOptions.get(k) for k in opt_list]
-
-        # Filter out empty ones
-        filtered_opt = []
-        filtered_p = []
-        for name, val in zip(opt_list, p_values):
-            if val not in ("", None):
-                filtered_opt.append(f'"{name}"')
-                filtered_p.append(str(val))
+            # Store command values the way the device reports them, so the next poll doesn't see a change
+            values = [int(value) if isinstance(value, str) and value.lstrip("-").isdigit() else value for value in newOptionsToOverride.values()]
+            changed = acOptions.apply(newOptionsToOverride, values)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                settings = ", ".join(f"{key}={value}" for key, value in newOptionsToOverride.items())
+                _LOGGER.debug(f"{self._name}: Overwriting device options with new settings: {settings}")
+        return changed
+
+    def GetOptionsToFetch(self, acOptions):
+        """Return the status columns to read for this sync."""
+        if not acOptions:
+            self._poll_cycle += 1
+            if self._poll_cycle % POLL_FULL_REFRESH_CYCLES == 0:
+                self._full_refresh_due = True
+        # Whatever a command touches is always read, so it can be diffed against fresh values
+        commandColumns = set(acOptions)
+        for key in acOptions:
+            commandColumns.update(COMMAND_COMPANION_OPTIONS.get(key, ()))
+
+        if self._full_refresh_due:
+            wanted = set(self._consumed_columns)
+        else:
+            wanted = self._consumed_columns.keys() & HOT_STATUS_COLUMNS
+        wanted |= commandColumns
+        return [key for key in self._optionsToFetch if key in wanted]
+
+    @callback
+    def async_add_column_consumer(self, columns, update_callback=None):
+        """
+        Register status columns read by an entity, and optionally a callback
+        run when one of them changes. Returns a callback that removes both.
+        """
+        listener = (frozenset(columns), update_callback)
+        if not self._consumed_columns.keys() >= listener[0]:
+            # Newly needed columns haven't been read yet
+            self._full_refresh_due = True
+        self._consumed_columns.update(listener[0])
+        self._state_listeners.append(listener)
+
+        @callback
+        def remove_consumer():
+            self._state_listeners.remove(listener)
+            self._consumed_columns.subtract(listener[0])
+            self._consumed_columns = +self._consumed_columns
+
+        return remove_consumer
+
+    def GetCommandOptions(self, acOptions):
+        """Return the minimal set of options needed to move the device to acOptions."""
+        changed = {}
+        for key, value in acOptions.items():
+            if value in ("", None):
+                continue
+            if str(self._acOptions.get(key)) != str(value):
+                changed[key] = value
+
+        # Some options are only interpreted together with their companion
+        for key in list(changed):
+            for companion in COMMAND_COMPANION_OPTIONS.get(key, ()):
+                if companion in changed:
+                    continue
+                value = acOptions.get(companion, self._acOptions.get(companion))
+                if value not in ("", None):
+                    changed[companion] = value
+        return changed
+
+    async def SendStateToAc(self, commandOptions):
+        filtered_opt = [f'"{name}"' for name in commandOptions]
+        filtered_p = [str(val) for val in commandOptions.values()]
 
         buzzer_command_value = 0 if self._beeper_enabled else 1
         filtered_opt.append('"Buzzer_ON_OFF"')
@@ -314,162 +598,78 @@ class GreeClimate(ClimateEntity):
             pack, tag = EncryptGCM(self._encryption_key, statePackJson)
             sentJsonPayload = '{"cid":"app","i":0,"pack":"' + pack + '","t":"pack","tcid":"' + str(self._mac_addr) + '","uid":{}'.format(self._uid) + ',"tag":"' + tag + '"}'
             cipher = GetGCMCipher(self._encryption_key)
-        result = await FetchResult(cipher, self._ip_addr, self._port, sentJsonPayload, encryption_version=self.encryption_version)
+        result = await FetchResult(self.hass, cipher, self._ip_addr, self._port, sentJsonPayload, encryption_version=self.encryption_version, budget=REQUEST_BUDGET_COMMAND, priority=PRIORITY_INTERACTIVE, hedge=self._hedge_requests)
         _LOGGER.debug(f"{self._name}: Command sent successfully: {str(result)}")
 
-    def UpdateHATargetTemperature(self):
-        # Sync set temperature to HA. If 8℃ heating is active we set the temp in HA to 8℃ so that it shows the same as the AC display.
-        if self._acOptions["StHt"] and (int(self._acOptions["StHt"]) == 1):
-            self._target_temperature = 8
-            _LOGGER.debug(f"{self._name}: Target temperature set to 8°C for 8°C heating mode")
-        else:
-            temp_c = decode_temp_c(SetTem=self._acOptions["SetTem"], TemRec=self._acOptions["TemRec"])  # takes care of 1/2 degrees
-            temp_f = gree_c_to_f(SetTem=self._acOptions["SetTem"], TemRec=self._acOptions["TemRec"])
-
-            if self._unit_of_measurement == "°C":
-                display_temp = temp_c
-            elif self._unit_of_measurement == "°F":
-                display_temp = temp_f
-            else:
-                display_temp = temp_c  # default to deg c
-                _LOGGER.error(f"{self._name}: Unknown unit of measurement: {self._unit_of_measurement}")
-
-            self._target_temperature = display_temp
-
-            _LOGGER.debug(f"{self._name}: Target temperature set to {self._target_temperature}{self._unit_of_measurement}")
-
-    def UpdateHAHvacMode(self):
-        # Sync current HVAC operation mode to HA
-        if self._acOptions["Pow"] == 0:
-            self._hvac_mode = HVACMode.OFF
-        else:
-            for key, value in MODES_MAPPING.get("Mod").items():
-                if value == (self._acOptions["Mod"]):
-                    self._hvac_mode = key
-        _LOGGER.debug(f"{self._name}: HVAC mode updated to {self._hvac_mode}")
-
-    def UpdateHACurrentSwingMode(self):
-        # Sync current HVAC Swing mode state to HA
-        for key, value in MODES_MAPPING.get("SwUpDn").items():
-            if value == (self._acOptions["SwUpDn"]):
-                self._swing_mode = key
-        _LOGGER.debug(f"{self._name}: Swing mode updated to {self._swing_mode}")
-
-    def UpdateHACurrentSwingHorizontalMode(self):
-        # Sync current HVAC Horizontal Swing mode state to HA
-        for key, value in MODES_MAPPING.get("SwingLfRig").items():
-            if value == (self._acOptions["SwingLfRig"]):
-                self._swing_horizontal_mode = key
-        _LOGGER.debug(f"{self._name}: Horizontal swing mode updated to {self._swing_horizontal_mode}")
-
-    def UpdateHAFanMode(self):
-        # Sync current HVAC Fan mode state to HA
-        if int(self._acOptions["Tur"]) == 1:
-            turbo_index = self._fan_modes.index("turbo")
-            self._fan_mode = self._fan_modes[turbo_index]
-        elif int(self._acOptions["Quiet"]) >= 1:
-            quiet_index = self._fan_modes.index("quiet")
-            self._fan_mode = self._fan_modes[quiet_index]
-        else:
-            for key, value in MODES_MAPPING.get("WdSpd").items():
-                if value == (self._acOptions["WdSpd"]):
-                    self._fan_mode = key
-        _LOGGER.debug(f"{self._name}: Fan mode updated to {self._fan_mode}")
-
     def UpdateHACurrentTemperature(self):
-        # Use external temperature sensor if available
-        if self._external_temperature_sensor:
-            # Use external temperature sensor
-            external_sensor_state = self.hass.states.get(self._external_temperature_sensor)
-            if external_sensor_state and external_sensor_state.state not in ("unknown", "unavailable"):
-                try:
-                    unit = external_sensor_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-                    _LOGGER.debug(f"{self._name}: Using external temperature sensor {self._external_temperature_sensor}: {external_sensor_state.state}{unit}")
-                    self._current_temperature = self.hass.config.units.temperature(float(external_sensor_state.state), unit)
-                    _LOGGER.debug(f"{self._name}: Current temperature from external sensor: {self._current_temperature}{self._unit_of_measurement}")
-                    return
-                except (ValueError, TypeError) as ex:
-                    _LOGGER.error(f"{self._name}: Unable to update from external temp sensor {self._external_temperature_sensor}: {ex}")
-
-        # Use built-in AC temperature sensor if available
-        if self._has_temp_sensor:
-            _LOGGER.debug(f"{self._name}: Built-in temperature sensor reading: {self._acOptions['TemSen']}")
-
-            if self._temp_sensor_offset is None:  # user hasn't chosen an offset
-                # User hasn't set automaticaly, so try to determine the offset
-                temp_c = self._process_temp_sensor(self._acOptions["TemSen"])
-                _LOGGER.debug("method UpdateHACurrentTemperature: User has not chosen an offset, using process_temp_sensor() to automatically determine offset.")
-            else:
-                # User set
-                if self._temp_sensor_offset is True:
-                    temp_c = self._acOptions["TemSen"] - TEMSEN_OFFSET
-
-                elif self._temp_sensor_offset is False:
-                    temp_c = self._acOptions["TemSen"]
-
-                _LOGGER.debug(f"method UpdateHACurrentTemperature: User has chosen an offset ({self._temp_sensor_offset})")
-
-            temp_f = gree_c_to_f(SetTem=temp_c, TemRec=0)  # Convert to Fahrenheit using TemRec bit
-
-            if self._unit_of_measurement == "°C":
-                self._current_temperature = temp_c
-            elif self._unit_of_measurement == "°F":
-                self._current_temperature = temp_f
-            else:
-                _LOGGER.error("Unknown unit of measurement: %s" % self._unit_of_measurement)
+        # Use external temperature sensor if available, the decoder already set the built-in reading
+        if self._external_temperature_sensor and self._external_temperature is not None:
+            self._current_temperature = self._external_temperature
 
-            _LOGGER.debug(f"{self._name}: UpdateHACurrentTemperature: HA current temperature set with device built-in temperature sensor state: {self._current_temperature}{self._unit_of_measurement}")
-
-    def UpdateHAOutsideTemperature(self):
-        # Update outside temperature from built-in AC outside temperature sensor if available
-        if self._has_outside_temp_sensor:
-            _LOGGER.debug(f"{self._name}: UpdateHAOutsideTemperature: OutEnvTem: {self._acOptions['OutEnvTem']}")
-
-            if self._temp_sensor_offset is None:  # user hasn't chosen an offset
-                # User hasn't set automatically, so try to determine the offset
-                temp_c = self._process_temp_sensor(self._acOptions["OutEnvTem"])
-                _LOGGER.debug("method UpdateHAOutsideTemperature: User has not chosen an offset, using process_temp_sensor() to automatically determine offset.")
-            else:
-                # User set
-                if self._temp_sensor_offset is True:
-                    temp_c = self._acOptions["OutEnvTem"] - TEMSEN_OFFSET
-                elif self._temp_sensor_offset is False:
-                    temp_c = self._acOptions["OutEnvTem"]
-
-                _LOGGER.debug(f"method UpdateHAOutsideTemperature: User has chosen an offset ({self._temp_sensor_offset})")
-
-            temp_f = gree_c_to_f(SetTem=temp_c, TemRec=0)  # Convert to Fahrenheit using TemRec bit
-
-            if self._unit_of_measurement == "°C":
-                self._current_outside_temperature = temp_c
-            elif self._unit_of_measurement == "°F":
-                self._current_outside_temperature = temp_f
-            else:
-                _LOGGER.error("Unknown unit of measurement for outside temperature: %s" % self._unit_of_measurement)
-
-            _LOGGER.debug(f"{self._name}: UpdateHAOutsideTemperature: HA outside temperature set with device built-in outside temperature sensor state: {self._current_outside_temperature}{self._unit_of_measurement}")
+    def _read_external_temperature(self, external_sensor_state):
+        """Convert an external sensor state to the HA temperature unit, None if it has no usable reading."""
+        if external_sensor_state is None or external_sensor_state.state in ("unknown", "unavailable"):
+            return None
+        try:
+            unit = external_sensor_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            _LOGGER.debug(f"{self._name}: Using external temperature sensor {self._external_temperature_sensor}: {external_sensor_state.state}{unit}")
+            return self.hass.config.units.temperature(float(external_sensor_state.state), unit)
+        except (ValueError, TypeError) as ex:
+            _LOGGER.error(f"{self._name}: Unable to update from external temp sensor {self._external_temperature_sensor}: {ex}")
+            return None
 
-    def UpdateHARoomHumidity(self):
-        # Update room humidity from built-in AC room humidity sensor if available
-        if self._has_room_humidity_sensor:
-            _LOGGER.debug(f"{self._name}: UpdateHARoomHumidity: DwatSen: {self._acOptions['DwatSen']}")
-            self._current_room_humidity = self._acOptions["DwatSen"]
-            _LOGGER.debug(f"{self._name}: UpdateHARoomHumidity: HA room humidity set with device built-in room humidity sensor state: {self._current_room_humidity}%")
+    @callback
+    def async_set_external_temperature_sensor(self, entity_id):
+        """Follow the given temperature sensor for the current temperature, or the built-in one for None."""
+        if entity_id == self._external_temperature_sensor:
+            return
+        for listener in [listener for listener in self._listeners if listener[0] == "external_temperature_sensor"]:
+            _LOGGER.debug("Deregistering %s listener for %s", listener[0], listener[1])
+            listener[2]()
+            self._listeners.remove(listener)
+
+        self._external_temperature_sensor = entity_id
+        self._external_temperature = None
+        if entity_id:
+            unsub = async_track_state_change_event(self.hass, [entity_id], self._async_external_temperature_changed)
+            self._listeners.append(("external_temperature_sensor", entity_id, unsub))
+            self._external_temperature = self._read_external_temperature(self.hass.states.get(entity_id))
+        self._async_push_current_temperature()
+
+    @callback
+    def _async_external_temperature_changed(self, event):
+        self._external_temperature = self._read_external_temperature(event.data.get("new_state"))
+        self._async_push_current_temperature()
+
+    @callback
+    def _async_push_current_temperature(self):
+        """Recompute the current temperature and write it to HA right away if it changed."""
+        previousTemperature = self._current_temperature
+        if self._has_temp_sensor and self._acOptions.get("TemSen") is not None:
+            self._current_temperature = self._status_decoder.sensor_temperature(self._acOptions["TemSen"])
+        self.UpdateHACurrentTemperature()
+        if self._current_temperature != previousTemperature:
+            _LOGGER.debug(f"{self._name}: Current temperature is now {self._current_temperature}{self._unit_of_measurement}")
+            self._async_notify_state_changes({"TemSen"}, False)
 
     def UpdateHAStateToCurrentACState(self):
-        self.UpdateHATargetTemperature()
-        self.UpdateHAHvacMode()
-        self.UpdateHACurrentSwingMode()
-        self.UpdateHACurrentSwingHorizontalMode()
-        self.UpdateHAFanMode()
+        self._status_decoder.decode(self._acOptions, self)
         self.UpdateHACurrentTemperature()
-        self.UpdateHAOutsideTemperature()
-        self.UpdateHARoomHumidity()
 
     async def SyncState(self, acOptions={}):
-        # Fetch current settings from HVAC
-        _LOGGER.debug(f"{self._name}: Starting device state sync")
-
+        if acOptions and self._first_sync_task is not None:
+            # A command needs the key and the confirmed state the first sync brings,
+            # but a first sync stuck behind unreachable units mustn't hold it up
+            _LOGGER.debug(f"{self._name}: Waiting for the first device sync before sending a command")
+            await asyncio.wait({self._first_sync_task}, timeout=FIRST_SYNC_COMMAND_WAIT)
+        if acOptions and not await self._async_ensure_key(PRIORITY_INTERACTIVE):
+            raise HomeAssistantError(f"{self._name}: No encryption key, the device didn't answer the bind request")
+        # Merge commands fired in quick succession (scenes, automations) into one packet
+        if acOptions and self._command_coalescer.window > 0:
+            return await self._command_coalescer.async_submit(acOptions)
+        return await self._async_sync_state(acOptions)
+
+    async def _async_detect_capabilities(self):
         if self._has_temp_sensor is None:
             _LOGGER.debug("Attempt to check whether device has an built-in temperature sensor")
             try:
@@ -554,52 +754,143 @@ class GreeClimate(ClimateEntity):
                     self._has_room_humidity_sensor = False
                     _LOGGER.debug("Device has no room humidity sensor")
 
-        optionsToFetch = self._optionsToFetch
+    async def _async_sync_state(self, acOptions={}):
+        wasAvailable = self.available
+        previousTemperature = self._current_temperature
+        changedOptions = await self._async_refresh_state(acOptions)
+        if self._current_temperature != previousTemperature:
+            # An external temperature sensor changes the reading without touching TemSen
+            changedOptions.add("TemSen")
+        self._async_notify_state_changes(changedOptions, self.available != wasAvailable)
+        if changedOptions and not self._firstTimeRun:
+            self._async_save_state()
+
+    async def _async_refresh_state(self, acOptions):
+        """Sync with the device and return the status columns whose value changed."""
+        # Fetch current settings from HVAC
+        _LOGGER.debug(f"{self._name}: Starting device state sync")
+        stateChanges = set()
+
+        # Commands don't wait for capability probes, the next poll runs them
+        if not acOptions and None in (self._has_temp_sensor, self._has_anti_direct_blow, self._has_light_sensor, self._has_outside_temp_sensor, self._has_room_humidity_sensor):
+            async with self._state_lock:
+                await self._async_detect_capabilities()
+
+        optionsToFetch = self.GetOptionsToFetch(acOptions)
+        fullRefresh = self._full_refresh_due
+        stateVersion = self._state_version
+        # Reads that precede a command jump the per-host queue, polls may be preempted by them
+        priority = PRIORITY_INTERACTIVE if acOptions else PRIORITY_BACKGROUND
 
         try:
-            currentValues = await self.GreeGetValues(optionsToFetch)
+            currentValues = await self.GreeGetValues(optionsToFetch, priority)
+        except GreeRequestPreempted:
+            _LOGGER.debug(f"{self._name}: Status poll preempted by a command, skipping this cycle")
+            return stateChanges
+        except GreeRequestNotSent:
+            # Our own queue was full, the device may be fine
+            _LOGGER.debug(f"{self._name}: Status read still queued when its time ran out, skipping this cycle")
+            return stateChanges
         except Exception as e:
             _LOGGER.warning(f"{self._name}: Failed to communicate with device {self._ip_addr}:{self._port}: {str(e)}")
             if not self._disable_available_check:
                 _LOGGER.info(f"{self._name}: Device marked offline after failed communication")
                 self._device_online = False
-        else:
+            self._poll_policy.record_failure()
+            return stateChanges
+
+        async with self._state_lock:
             if not self._disable_available_check:
                 if not self._device_online:
                     self._device_online = True
-            # Set latest status from device
-            self._acOptions = self.SetAcOptions(self._acOptions, optionsToFetch, currentValues)
+            # Set latest status from device, unless a command went out while we were reading
+            if stateVersion == self._state_version:
+                polledChanges = self.SetAcOptions(self._acOptions, optionsToFetch, currentValues)
+                stateChanges.update(polledChanges)
+                changedOptions = [key for key in polledChanges if key not in SENSOR_STATUS_COLUMNS]
+                self._poll_policy.record_success(bool(changedOptions))
+                if not self._firstTimeRun and ("Pow" in changedOptions or "Mod" in changedOptions):
+                    # Mode changed outside HA (remote control, app): follow up quickly
+                    self._poll_policy.record_activity()
+                if fullRefresh:
+                    self._full_refresh_due = False
+                elif changedOptions and not acOptions:
+                    # Someone used the remote; configuration columns may have changed too
+                    _LOGGER.debug(f"{self._name}: Device changed outside HA ({', '.join(changedOptions)}), refreshing all columns next poll")
+                    self._full_refresh_due = True
+            else:
+                _LOGGER.debug(f"{self._name}: Discarding status read that started before the last command")
+
+            # Only send what differs from the state the device just confirmed
+            commandOptions = self.GetCommandOptions(acOptions)
 
             # Overwrite status with our choices
             if not (acOptions == {}):
-                self._acOptions = self.SetAcOptions(self._acOptions, acOptions)
-
-            # If not the first (boot) run, update state towards the HVAC
-            if not (self._firstTimeRun):
-                if not (acOptions == {}):
-                    # loop used to send changed settings from HA to HVAC
-                    try:
-                        await self.SendStateToAc()
-                    except Exception as e:
-                        _LOGGER.warning(f"{self._name}: Failed to send state to device {self._ip_addr}:{self._port}: {str(e)}")
-                        # Mark device as offline if communication fails
-                        if not self._disable_available_check:
-                            _LOGGER.info(f"{self._name}: Device marked offline after failed send attempt")
-                            self._device_online = False
-            else:
-                # loop used once for Gree Climate initialisation only
-                self._firstTimeRun = False
+                stateChanges.update(self.SetAcOptions(self._acOptions, acOptions))
+
+            # Send user changes to the HVAC; commandOptions only ever holds what the user asked for,
+            # so the state read on the first (boot) run is never pushed back to the unit
+            if commandOptions:
+                # loop used to send changed settings from HA to HVAC
+                self._state_version += 1
+                self._poll_policy.record_activity()
+                try:
+                    await self.SendStateToAc(commandOptions)
+                except GreeRequestNotSent as e:
+                    _LOGGER.warning(f"{self._name}: Command to {self._ip_addr}:{self._port} not sent, too many requests queued: {str(e)}")
+                except Exception as e:
+                    _LOGGER.warning(f"{self._name}: Failed to send state to device {self._ip_addr}:{self._port}: {str(e)}")
+                    # Mark device as offline if communication fails
+                    if not self._disable_available_check:
+                        _LOGGER.info(f"{self._name}: Device marked offline after failed send attempt")
+                        self._device_online = False
+            elif not (acOptions == {}):
+                _LOGGER.debug(f"{self._name}: Device already in requested state, nothing to send")
+            self._firstTimeRun = False
 
             # Update HA state to current HVAC state
             self.UpdateHAStateToCurrentACState()
 
-            _LOGGER.debug(f"{self._name}: Finished device state sync")
+        # Pull the next poll forward if a command just made the unit busy
+        if self._poll_unsub is not None:
+            self._schedule_poll()
+
+        _LOGGER.debug(f"{self._name}: Finished device state sync")
+        return stateChanges
+
+    @callback
+    def _async_notify_state_changes(self, changedOptions, availabilityChanged):
+        """Write HA state only for entities whose source columns changed."""
+        if not changedOptions and not availabilityChanged:
+            _LOGGER.debug(f"{self._name}: No state changes after sync")
+            return
+        for columns, update_callback in list(self._state_listeners):
+            if update_callback is not None and (availabilityChanged or not columns.isdisjoint(changedOptions)):
+                update_callback()
 
     @property
     def should_poll(self):
-        _LOGGER.debug("should_poll()")
-        # Return the polling state.
-        return True
+        # Polling is scheduled by _schedule_poll() at an adaptive interval
+        return False
+
+    @callback
+    def _schedule_poll(self, phase=1.0):
+        if self._poll_unsub is not None:
+            self._poll_unsub()
+            self._poll_unsub = None
+        if not self._poll_enabled:
+            return
+        delay = self._poll_policy.next_interval(powered_on=self._acOptions["Pow"] != 0)
+        delay = max(delay * phase, POLL_INTERVAL_FAST)
+        _LOGGER.debug(f"{self._name}: Next status poll in {delay}s")
+        self._poll_unsub = async_call_later(self.hass, delay, self._async_poll)
+
+    async def _async_poll(self, _now=None):
+        self._poll_unsub = None
+        try:
+            await self.async_update()
+        finally:
+            self._schedule_poll()
 
     @property
     def available(self):
@@ -616,24 +907,31 @@ class GreeClimate(ClimateEntity):
     async def async_update(self):
         """Retrieve latest state."""
         _LOGGER.debug("async_update()")
-        if not self._encryption_key:
-            if self.encryption_version == 1:
-                key = await GetDeviceKey(self._mac_addr, self._ip_addr, self._port)
-                if key:
-                    self._encryption_key = key
-                    self.CIPHER = AES.new(self._encryption_key, AES.MODE_ECB)
-                    await self.SyncState()
-            elif self.encryption_version == 2:
-                key = await GetDeviceKeyGCM(self._mac_addr, self._ip_addr, self._port)
-                if key:
-                    self._encryption_key = key
-                    self.CIPHER = GetGCMCipher(self._encryption_key)
-                    await self.SyncState()
-            else:
-                _LOGGER.error("Encryption version %s is not implemented." % self.encryption_version)
-        else:
+        if await self._async_ensure_key():
             await self.SyncState()
 
+    async def _async_ensure_key(self, priority=PRIORITY_BACKGROUND):
+        """Bind for the device key unless one is known; return whether there is a key."""
+        if self._encryption_key:
+            return True
+        if self.encryption_version not in (1, 2):
+            _LOGGER.error("Encryption version %s is not implemented." % self.encryption_version)
+            return False
+        try:
+            # Sub-units behind one gateway share a single bind
+            key = await async_get_bind_key(self.hass, self._mac_addr, self._ip_addr, self._port, self.encryption_version, budget=REQUEST_BUDGET_BIND, priority=priority)
+        except (GreeRequestPreempted, GreeRequestNotSent):
+            _LOGGER.debug(f"{self._name}: Key bind preempted or still queued, retrying on the next poll")
+            return False
+        if not key:
+            self._poll_policy.record_failure()
+            return False
+        if not self._encryption_key:
+            self._encryption_key = key
+            self._bound_key = True
+            self.CIPHER = AES.new(self._encryption_key, AES.MODE_ECB) if self.encryption_version == 1 else GetGCMCipher(self._encryption_key)
+        return True
+
     @property
     def name(self):
         _LOGGER.debug(f"{self._name}: name() = {self._name}")
@@ -859,7 +1157,7 @@ class GreeClimate(ClimateEntity):
                     await self.SyncState({"Tur": 0, "Quiet": 1})
                 else:
                     _LOGGER.info(f"{self._name}: Setting normal fan mode to {wd_spd}")
-                    await self.SyncState({"WdSpd": str(wd_spd), "Tur": 0, "Quiet": 0})
+                    await self.SyncState({"WdSpd": int(wd_spd), "Tur": 0, "Quiet": 0})
 
                 self.async_write_ha_state()
             except ValueError:
@@ -907,10 +1205,37 @@ class GreeClimate(ClimateEntity):
 
     async def async_added_to_hass(self):
         _LOGGER.info("Gree climate device added to hass()")
-        await self.async_update()
+        self.async_on_remove(self.async_add_column_consumer(CLIMATE_STATUS_COLUMNS, self.async_write_ha_state))
+        # Binding and probing an unresponsive unit can take a while, don't hold up platform setup for it
+        self._first_sync_task = self.hass.async_create_background_task(self._async_first_sync(), f"{DOMAIN} {self._name} first sync")
+
+    async def _async_first_sync(self):
+        try:
+            # Spread out the bind handshakes at boot, when every unit starts at once; a single reload only waits for a slot
+            async with get_startup_scheduler(self.hass).slot(jitter=not self.hass.is_running):
+                hasKey = await self._async_ensure_key()
+            if hasKey:
+                await self.SyncState()
+        except Exception:
+            _LOGGER.exception(f"{self._name}: First device sync failed, retrying on the next poll")
+        self._first_sync_task = None
+        self._poll_enabled = True
+        # Start at a random phase of the interval so units don't keep polling in lockstep
+        self._schedule_poll(phase=random.random())
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed."""
+        self._command_coalescer.cancel()
+        if self._bound_key:
+            # A reload binds again, which is how a stale key gets replaced
+            forget_bind_key(self.hass, self._mac_addr, self.encryption_version)
+        if self._first_sync_task is not None:
+            self._first_sync_task.cancel()
+            self._first_sync_task = None
+        self._poll_enabled = False
+        if self._poll_unsub is not None:
+            self._poll_unsub()
+            self._poll_unsub = None
         for name, entity_id, unsub in self._listeners:
             _LOGGER.debug("Deregistering %s listener for %s", name, entity_id)
             unsub()
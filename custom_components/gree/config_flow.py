@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 # Standard library imports
+import asyncio
 import ipaddress
 import logging
 
@@ -23,30 +24,51 @@ from homeassistant.helpers import selector
 
 # Local imports
 from .const import (
+    CONF_COMMAND_COALESCE_WINDOW,
+    CONF_HEDGE_REQUESTS,
+    CONF_DEVICES,
     CONF_DISABLE_AVAILABLE_CHECK,
     CONF_ENCRYPTION_KEY,
     CONF_ENCRYPTION_VERSION,
     CONF_EXTRA_SCAN_HOSTS,
     CONF_EXTRA_SCAN_NETWORKS,
     CONF_FAN_MODES,
+    CONF_HUB,
     CONF_HVAC_MODES,
+    CONF_MAX_REQUESTS_IN_FLIGHT,
+    CONF_MAX_REQUESTS_PER_HOST,
     CONF_SWING_HORIZONTAL_MODES,
     CONF_SWING_MODES,
     CONF_TEMP_SENSOR_OFFSET,
     CONF_UID,
+    BULK_VALIDATION_CONCURRENCY,
+    DEFAULT_COMMAND_COALESCE_WINDOW,
     DEFAULT_FAN_MODES,
     DEFAULT_HVAC_MODES,
+    DEFAULT_MAX_REQUESTS_IN_FLIGHT,
+    DEFAULT_MAX_REQUESTS_PER_HOST,
     DEFAULT_PORT,
     DEFAULT_SWING_HORIZONTAL_MODES,
     DEFAULT_SWING_MODES,
     DOMAIN,
+    HUB_OPTION_KEYS,
+    MAX_COMMAND_COALESCE_WINDOW,
+    MAX_REQUESTS_IN_FLIGHT,
+    MAX_REQUESTS_PER_HOST,
     MAX_UNICAST_SCAN_HOSTS,
     OPTION_KEYS,
+    REQUEST_LIMIT_OPTION_KEYS,
 )
-from .gree_protocol import test_connection, discover_gree_devices, detect_device_encryption
+from .gree_protocol import test_connection, discover_gree_devices, detect_device_encryption, get_cached_bind_key, normalize_mac
+from .helpers import async_run_import_flows
 
 _LOGGER = logging.getLogger(__name__)
 
+# Discovery choices that add every discovered device not configured yet, as entries of their own or to the hub entry
+ADD_ALL_DISCOVERED = "add_all"
+ADD_ALL_TO_HUB = "add_all_hub"
+HUB_UNIQUE_ID = f"{DOMAIN}_hub"
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Gree climate."""
@@ -148,6 +170,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # User selected a discovered device
             selected_device = user_input["device"]
+            if selected_device in (ADD_ALL_DISCOVERED, ADD_ALL_TO_HUB):
+                return await self.async_step_add_all(to_hub=selected_device == ADD_ALL_TO_HUB)
 
             for device in self._discovered_devices:
                 device_id = f"{device['mac']}_{device['host']}"
@@ -155,6 +179,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Check if already configured
                     await self.async_set_unique_id(device["mac"])
                     self._abort_if_unique_id_configured()
+                    if device["mac"] in self._hub_macs():
+                        return self.async_abort(reason="already_configured")
 
                     # Store selected device for next step
                     self._selected_device = device
@@ -176,6 +202,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Create device selection options
         device_options = {}
+        new_devices = self._new_discovered_devices()
+        if len(new_devices) > 1:
+            device_options[ADD_ALL_DISCOVERED] = f"Add all {len(new_devices)} new devices"
+        if new_devices:
+            device_options[ADD_ALL_TO_HUB] = f"Add all {len(new_devices)} new devices to one hub entry"
         for device in self._discovered_devices:
             device_id = f"{device['mac']}_{device['host']}"
             device_options[device_id] = f"IP: {device['host']}, MAC: {device['mac']}"
@@ -184,24 +215,83 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(step_id="discovery", data_schema=data_schema, description_placeholders={"devices_found": str(len(self._discovered_devices))})
 
+    def _hub_entry(self) -> config_entries.ConfigEntry | None:
+        return next((entry for entry in self._async_current_entries() if entry.data.get(CONF_HUB)), None)
+
+    def _hub_macs(self) -> set[str]:
+        hub_entry = self._hub_entry()
+        return {device_config[CONF_MAC] for device_config in hub_entry.data[CONF_DEVICES]} if hub_entry else set()
+
+    def _new_discovered_devices(self) -> list[dict]:
+        configured = self._async_current_ids() | self._hub_macs()
+        return [device for device in self._discovered_devices if device["mac"] not in configured]
+
+    async def _async_validate_discovered(self, device: dict, semaphore: asyncio.Semaphore) -> dict | None:
+        """Detect encryption and fetch the key of a discovered device, returning its entry data."""
+        async with semaphore:
+            encryption_version = await detect_device_encryption(self.hass, device["mac"], device["host"], device["port"])
+        if encryption_version is None:
+            _LOGGER.warning("Could not connect to discovered device %s at %s, not adding it", device["mac"], device["host"])
+            return None
+        key = get_cached_bind_key(self.hass, device["mac"], encryption_version)
+        return {
+            CONF_NAME: device["name"],
+            CONF_HOST: device["host"],
+            CONF_MAC: device["mac"],
+            CONF_PORT: device["port"],
+            CONF_ENCRYPTION_KEY: key.decode("utf8") if key else "",
+            CONF_ENCRYPTION_VERSION: encryption_version,
+        }
+
+    async def async_step_add_all(self, user_input: dict | None = None, to_hub: bool = False) -> FlowResult:
+        """Validate all new discovered devices concurrently and add every one that answered."""
+        devices = self._new_discovered_devices()
+        semaphore = asyncio.Semaphore(BULK_VALIDATION_CONCURRENCY)
+        results = await asyncio.gather(*(self._async_validate_discovered(device, semaphore) for device in devices))
+        configs = [config for config in results if config is not None]
+        _LOGGER.info("Adding %s of %s discovered devices", len(configs), len(devices))
+        if not configs:
+            return self.async_abort(reason="cannot_connect")
+
+        if to_hub:
+            hub_entry = self._hub_entry()
+            if hub_entry is None:
+                await self.async_set_unique_id(HUB_UNIQUE_ID)
+                return self.async_create_entry(title="Gree Hub", data={CONF_HUB: True, CONF_DEVICES: configs})
+            # The hub adds just the new devices when its entry changes
+            self.hass.config_entries.async_update_entry(hub_entry, data={**hub_entry.data, CONF_DEVICES: [*hub_entry.data[CONF_DEVICES], *configs]})
+            return self.async_abort(reason="devices_added", description_placeholders={"count": str(len(configs))})
+
+        # A flow creates one entry; the others go through import flows, which skip validation given a key
+        first, *others = configs
+        if others:
+            self.hass.async_create_background_task(async_run_import_flows(self.hass, others, BULK_VALIDATION_CONCURRENCY), f"{DOMAIN} import of discovered devices")
+        await self.async_set_unique_id(first[CONF_MAC])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=first[CONF_NAME], data=first)
+
     async def async_step_detect_encryption(self, user_input: dict | None = None) -> FlowResult:
         """Detect encryption version and configure device."""
         if user_input is not None:
             # User entered device name, proceed with setup
             device_name = user_input[CONF_NAME]
 
-            # Create final configuration
+            # Create final configuration, with the key the detection bind already obtained
+            encryption_key = self._selected_device.get("encryption_key")
             self._data = {
                 CONF_NAME: device_name,
                 CONF_HOST: self._selected_device["host"],
                 CONF_MAC: self._selected_device["mac"],
                 CONF_PORT: self._selected_device["port"],
-                CONF_ENCRYPTION_KEY: "",
+                CONF_ENCRYPTION_KEY: encryption_key or "",
                 CONF_ENCRYPTION_VERSION: self._selected_device["encryption_version"],
             }
 
-            # Test the connection
-            is_connection_valid = await test_connection(self._data)
+            # The device answered the detection bind; only test the connection if that gave no key
+            if encryption_key:
+                return self.async_create_entry(title=device_name, data=self._data)
+
+            is_connection_valid = await test_connection(self.hass, self._data)
             if not is_connection_valid:
                 return self.async_show_form(
                     step_id="detect_encryption",
@@ -220,7 +310,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         ip_addr = self._selected_device["host"]
         port = self._selected_device["port"]
 
-        encryption_version = await detect_device_encryption(mac_addr, ip_addr, port)
+        encryption_version = await detect_device_encryption(self.hass, mac_addr, ip_addr, port)
 
         if encryption_version is None:
             # Could not detect encryption, pre-fill manual form with discovered device info
@@ -249,8 +339,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors={"base": "cannot_connect"},
             )
 
-        # Store detected encryption version
+        # Store detected encryption version and the key its bind returned
         self._selected_device["encryption_version"] = encryption_version
+        key = get_cached_bind_key(self.hass, mac_addr, encryption_version)
+        self._selected_device["encryption_key"] = key.decode("utf8") if key else None
 
         # Show device naming form with detected info
         data_schema = vol.Schema(
@@ -270,8 +362,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Check if already configured by MAC
             await self.async_set_unique_id(self._data[CONF_MAC])
             self._abort_if_unique_id_configured()
+            if normalize_mac(self._data[CONF_MAC]) in self._hub_macs():
+                return self.async_abort(reason="already_configured")
 
-            is_connection_valid = await test_connection(self._data)
+            is_connection_valid = await test_connection(self.hass, self._data)
             if not is_connection_valid:
                 errors["base"] = "cannot_connect"
             else:
@@ -293,8 +387,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(step_id="manual", data_schema=data_schema, errors=errors)
 
     async def async_step_import(self, import_data: dict) -> FlowResult:
-        """Handle configuration via YAML import."""
-        return await self.async_step_user(import_data)
+        """Handle configuration via YAML import and devices added together from discovery."""
+        # Use the MAC format discovery reports, so a unit is found however the YAML spells its MAC
+        mac_addr = normalize_mac(import_data[CONF_MAC])
+        if import_data[CONF_MAC] in self._async_current_ids() or mac_addr in self._hub_macs():
+            # Entries made before the MAC was normalised keep the spelling they were created with
+            return self.async_abort(reason="already_configured")
+        await self.async_set_unique_id(mac_addr)
+        self._abort_if_unique_id_configured()
+        import_data = {**import_data, CONF_MAC: mac_addr}
+
+        self._data = {CONF_ENCRYPTION_KEY: "", **import_data}
+        if not self._data[CONF_ENCRYPTION_KEY] and not await test_connection(self.hass, self._data):
+            return self.async_abort(reason="cannot_connect")
+        return self.async_create_entry(title=import_data[CONF_NAME], data=import_data)
 
     @staticmethod
     @callback
@@ -308,11 +414,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle an options flow for Gree climate."""
 
     async def async_step_init(self, user_input: dict | None = None) -> FlowResult:
+        if self.config_entry.data.get(CONF_HUB):
+            return await self.async_step_hub(user_input)
         if user_input is not None:
             _LOGGER.debug("Raw user options input: %s", user_input)
             normalized_input: dict[str, str | None] = {}
             # Only handle known option keys
-            for key in OPTION_KEYS:
+            for key in OPTION_KEYS | REQUEST_LIMIT_OPTION_KEYS:
                 if key in user_input:
                     value = user_input[key]
                     normalized_input[key] = value if value not in (None, "") else None
@@ -323,7 +431,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             _LOGGER.debug("Creating entry with options: %s", normalized_input)
             return result
 
-        options = {key: value for key, value in self.config_entry.options.items() if key in OPTION_KEYS}
+        options = {key: value for key, value in self.config_entry.options.items() if key in OPTION_KEYS | REQUEST_LIMIT_OPTION_KEYS}
         _LOGGER.debug("Current stored options: %s", options)
         schema = vol.Schema(
             {
@@ -355,6 +463,43 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_TEMP_SENSOR_OFFSET,
                     description={"suggested_value": options.get(CONF_TEMP_SENSOR_OFFSET)},
                 ): vol.Any(None, bool),
+                vol.Optional(
+                    CONF_COMMAND_COALESCE_WINDOW,
+                    default=options.get(CONF_COMMAND_COALESCE_WINDOW, DEFAULT_COMMAND_COALESCE_WINDOW),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_COMMAND_COALESCE_WINDOW)),
+                vol.Optional(
+                    CONF_HEDGE_REQUESTS,
+                    default=options.get(CONF_HEDGE_REQUESTS, False),
+                ): bool,
+                # Shared by all entries; left empty, the defaults or another entry's settings apply
+                vol.Optional(
+                    CONF_MAX_REQUESTS_IN_FLIGHT,
+                    description={"suggested_value": options.get(CONF_MAX_REQUESTS_IN_FLIGHT)},
+                ): vol.Any(None, vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_IN_FLIGHT))),
+                vol.Optional(
+                    CONF_MAX_REQUESTS_PER_HOST,
+                    description={"suggested_value": options.get(CONF_MAX_REQUESTS_PER_HOST)},
+                ): vol.Any(None, vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_PER_HOST))),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
+
+    async def async_step_hub(self, user_input: dict | None = None) -> FlowResult:
+        """Options of a hub entry: the request limits shared by all devices."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data={key: value for key, value in user_input.items() if key in HUB_OPTION_KEYS})
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_REQUESTS_IN_FLIGHT,
+                    default=options.get(CONF_MAX_REQUESTS_IN_FLIGHT, DEFAULT_MAX_REQUESTS_IN_FLIGHT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_IN_FLIGHT)),
+                vol.Optional(
+                    CONF_MAX_REQUESTS_PER_HOST,
+                    default=options.get(CONF_MAX_REQUESTS_PER_HOST, DEFAULT_MAX_REQUESTS_PER_HOST),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_REQUESTS_PER_HOST)),
+            }
+        )
+        return self.async_show_form(step_id="hub", data_schema=schema)
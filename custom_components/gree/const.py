@@ -9,13 +9,96 @@ CONF_SWING_HORIZONTAL_MODES = 'swing_horizontal_modes'
 CONF_ENCRYPTION_VERSION = 'encryption_version'
 CONF_DISABLE_AVAILABLE_CHECK  = 'disable_available_check'
 CONF_TEMP_SENSOR_OFFSET = 'temp_sensor_offset'
+CONF_COMMAND_COALESCE_WINDOW = 'command_coalesce_window'
+CONF_HEDGE_REQUESTS = 'hedge_requests'
 CONF_EXTRA_SCAN_NETWORKS = 'extra_scan_networks'
+# Hub entries manage many devices, listed under CONF_DEVICES
+CONF_HUB = 'hub'
+CONF_DEVICES = 'devices'
+CONF_MAX_REQUESTS_IN_FLIGHT = 'max_requests_in_flight'
+CONF_MAX_REQUESTS_PER_HOST = 'max_requests_per_host'
 CONF_EXTRA_SCAN_HOSTS = 'extra_scan_hosts'
 
 MAX_UNICAST_SCAN_HOSTS = 65536
 
 DEFAULT_PORT = 7000
 DEFAULT_TARGET_TEMP_STEP = 1
+# Milliseconds to wait for further commands before sending them as one packet
+DEFAULT_COMMAND_COALESCE_WINDOW = 50
+MAX_COMMAND_COALESCE_WINDOW = 2000
+
+# Adaptive status polling (seconds)
+POLL_INTERVAL_FAST = 5
+POLL_INTERVAL_NORMAL = 60
+POLL_INTERVAL_IDLE = 180
+POLL_INTERVAL_OFFLINE_MAX = 900
+# Poll fast for this long after a command or an observed mode change
+POLL_FAST_WINDOW = 30
+# Poll slowly once nothing has changed for this long
+POLL_IDLE_AFTER = 600
+
+# Device requests: seconds to wait for one reply, and the total time budget
+# (queueing, retries and backoff included) each kind of request gets
+REQUEST_TIMEOUT = 2
+REQUEST_MIN_ATTEMPT = 0.5
+REQUEST_BUDGET_COMMAND = 8
+REQUEST_BUDGET_POLL = 15
+REQUEST_BUDGET_BIND = 20
+REQUEST_BUDGET_CONFIG_FLOW = 10
+REQUEST_BUDGET_DEFAULT = REQUEST_BUDGET_POLL
+
+# Device requests in flight at once, across the integration and per host
+DEFAULT_MAX_REQUESTS_IN_FLIGHT = 16
+DEFAULT_MAX_REQUESTS_PER_HOST = 1
+MAX_REQUESTS_IN_FLIGHT = 64
+MAX_REQUESTS_PER_HOST = 4
+
+# Hedged requests: resend after the host's p95 round trip time, once this many of the last HEDGE_RTT_SAMPLES round trips are known
+HEDGE_RTT_SAMPLES = 50
+HEDGE_MIN_SAMPLES = 10
+# Never resend sooner than this (seconds)
+HEDGE_MIN_DELAY = 0.05
+
+# A /24 is considered down once this many different hosts failed within SUBNET_OUTAGE_WINDOW seconds, with no answer from any unit in that window.
+# It is then probed with one request at a time, backing off from SUBNET_PROBE_INTERVAL to SUBNET_PROBE_INTERVAL_MAX seconds.
+SUBNET_OUTAGE_HOSTS = 3
+SUBNET_OUTAGE_WINDOW = 60
+SUBNET_PROBE_INTERVAL = 30
+SUBNET_PROBE_INTERVAL_MAX = 600
+
+# Discovered devices validated at once when adding all of them from the config flow
+BULK_VALIDATION_CONCURRENCY = 4
+
+# YAML devices imported at once
+YAML_IMPORT_CONCURRENCY = 4
+
+# First syncs after startup: at most this many run at once, each after a random delay of up to STARTUP_JITTER seconds
+STARTUP_MAX_CONCURRENT = 4
+STARTUP_JITTER = 5
+# A command waits at most this long (seconds) for the first sync of its device, then binds and syncs by itself
+FIRST_SYNC_COMMAND_WAIT = 5
+
+# Last known device state, restored at startup
+STORAGE_VERSION = 1
+# Seconds to collect state changes before writing them to disk
+STORAGE_SAVE_DELAY = 60
+
+# Every status column the integration knows about, in device state layout order
+STATUS_COLUMNS = (
+    "Pow", "Mod", "SetTem", "WdSpd", "Air", "Blo", "Health", "SwhSlp", "Lig", "SwingLfRig", "SwUpDn", "Quiet",
+    "Tur", "StHt", "TemUn", "HeatCoolType", "TemRec", "SvSt", "SlpMod",
+    "TemSen", "AntiDirectBlow", "LigSen", "OutEnvTem", "DwatSen",
+)
+
+# Status columns read on every poll. The remaining (configuration) columns
+# normally only change when we send a command, so they are read every
+# POLL_FULL_REFRESH_CYCLES polls or right after a change made elsewhere.
+HOT_STATUS_COLUMNS = ("Pow", "Mod", "SetTem", "TemRec", "WdSpd", "Tur", "Quiet", "TemSen", "OutEnvTem", "DwatSen")
+POLL_FULL_REFRESH_CYCLES = 5
+# Status columns read by the climate entity itself
+CLIMATE_STATUS_COLUMNS = ("Pow", "Mod", "SetTem", "TemRec", "StHt", "WdSpd", "Tur", "Quiet", "SwUpDn", "SwingLfRig", "TemSen", "OutEnvTem", "DwatSen")
+# Measurements drift on their own and don't indicate that someone used the unit
+SENSOR_STATUS_COLUMNS = ("TemSen", "OutEnvTem", "DwatSen")
 
 MIN_TEMP_C = 16
 MAX_TEMP_C = 30
@@ -32,6 +115,14 @@ DEFAULT_FAN_MODES = ["auto", "low", "medium_low", "medium", "medium_high", "high
 DEFAULT_SWING_MODES = ["default", "swing_full", "fixed_upmost", "fixed_middle_up", "fixed_middle", "fixed_middle_low", "fixed_lowest", "swing_downmost", "swing_middle_low", "swing_middle", "swing_middle_up", "swing_upmost"]
 DEFAULT_SWING_HORIZONTAL_MODES = ["default", "swing_full", "fixed_leftmost", "fixed_middle_left", "fixed_middle", "fixed_middle_right", "fixed_rightmost"]
 
+# Options that must accompany a changed option in a command packet
+COMMAND_COMPANION_OPTIONS = {
+    "SetTem": ("TemRec",),
+    "TemRec": ("SetTem",),
+    "SwhSlp": ("SlpMod",),
+    "SlpMod": ("SwhSlp",),
+}
+
 # Keys that can be updated via the options flow
 OPTION_KEYS = {
     CONF_HVAC_MODES,
@@ -40,8 +131,19 @@ OPTION_KEYS = {
     CONF_SWING_HORIZONTAL_MODES,
     CONF_DISABLE_AVAILABLE_CHECK,
     CONF_TEMP_SENSOR_OFFSET,
+    CONF_COMMAND_COALESCE_WINDOW,
+    CONF_HEDGE_REQUESTS,
+}
+
+# Integration-wide request limits, settable from the options flow of any entry; the lowest setting wins
+REQUEST_LIMIT_OPTION_KEYS = {
+    CONF_MAX_REQUESTS_IN_FLIGHT,
+    CONF_MAX_REQUESTS_PER_HOST,
 }
 
+# Keys that can be updated via the options flow of a hub entry
+HUB_OPTION_KEYS = REQUEST_LIMIT_OPTION_KEYS
+
 MODES_MAPPING = {
   "Mod" : {
     "auto" : 0,
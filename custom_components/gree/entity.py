@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 # Home Assistant imports
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo, Entity
 
@@ -35,22 +36,63 @@ class GreeEntityDescription:
     value_fn: Callable[[object], Any] = None
     available_fn: Callable[[object], bool] = lambda device: True
     icon_fn: Callable[[Any, object], str] = None
+    source_columns: tuple[str, ...] = ()
+    """Device status columns read by value_fn and available_fn."""
+    polled: bool = False
+    """Refreshed by HA polling, for values that don't come from a status column."""
+
+
+@callback
+def async_setup_device_entities(hass, entry, async_add_entities, create_entities: Callable[[object], list]) -> None:
+    """
+    Add the entities create_entities returns for every device of the entry.
+    The factory is kept, so a hub entry can add the entities of devices it
+    gains later without setting up the platform again.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entry_data["entity_factories"].append((async_add_entities, create_entities))
+    entities = []
+    for device in entry_data["devices"].values():
+        device_entities = create_entities(device)
+        entry_data["entities"].setdefault(device, []).extend(device_entities)
+        entities.extend(device_entities)
+    if entities:
+        async_add_entities(entities)
+
+
+@callback
+def async_add_entities_for_device(entry_data, device) -> None:
+    """Add the entities of a device that joined a hub entry on every platform already set up."""
+    for async_add_entities, create_entities in entry_data["entity_factories"]:
+        device_entities = create_entities(device)
+        entry_data["entities"].setdefault(device, []).extend(device_entities)
+        if device_entities:
+            async_add_entities(device_entities)
 
 
 class GreeEntity(Entity):
     """Base Gree entity."""
 
     _attr_has_entity_name = True
+    # The device writes our state when one of our source columns changes
+    _attr_should_poll = False
     entity_description: GreeEntityDescription
 
-    def __init__(self, hass, entry, description: GreeEntityDescription) -> None:
+    def __init__(self, hass, entry, description: GreeEntityDescription, device=None) -> None:
         """Initialize Gree entity."""
-        # Get the device from the entry data
+        # Get the device from the entry data, unless given one of the devices of a hub entry
         entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-        self._device = entry_data.get("device")
+        self._device = device or entry_data.get("device")
         self.entity_description = description
+        self._attr_should_poll = description.polled
         self._set_id()
 
+    async def async_added_to_hass(self) -> None:
+        """Ask the device to poll the columns this entity reads and to tell us when they change."""
+        await super().async_added_to_hass()
+        # Registered even without source columns so availability changes still reach us
+        self.async_on_remove(self._device.async_add_column_consumer(self.entity_description.source_columns, self.async_write_ha_state))
+
     def _set_id(self) -> None:
         """Set entity ID and unique ID."""
         if self.entity_description:
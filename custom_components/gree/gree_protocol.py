@@ -11,7 +11,8 @@ import select
 import socket
 import struct
 import time
-from contextlib import suppress
+from collections import deque
+from contextlib import asynccontextmanager, suppress
 
 try:
     import fcntl
@@ -33,8 +34,24 @@ from homeassistant.components.network import async_get_ipv4_broadcast_addresses
 from .const import (
     CONF_ENCRYPTION_VERSION,
     CONF_ENCRYPTION_KEY,
+    DEFAULT_MAX_REQUESTS_IN_FLIGHT,
+    DOMAIN,
+    DEFAULT_MAX_REQUESTS_PER_HOST,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_RTT_SAMPLES,
     MAX_UNICAST_SCAN_HOSTS,
+    REQUEST_BUDGET_BIND,
+    REQUEST_BUDGET_CONFIG_FLOW,
+    REQUEST_BUDGET_DEFAULT,
+    REQUEST_MIN_ATTEMPT,
+    REQUEST_TIMEOUT,
+    SUBNET_OUTAGE_HOSTS,
+    SUBNET_OUTAGE_WINDOW,
+    SUBNET_PROBE_INTERVAL,
+    SUBNET_PROBE_INTERVAL_MAX,
 )
+from .helpers import SingleFlight
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,64 +65,422 @@ SIOCGIFFLAGS = 0x8913
 SIOCGIFADDR = 0x8915
 SIOCGIFBRDADDR = 0x8919
 
+# Request priorities: user commands are served before background polling
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
 
-async def FetchResult(cipher, ip_addr, port, json_data, encryption_version=1, max_retries=8):
-    """Send a request to a Gree device and fetch the result, with retries and timeouts."""
 
-    _LOGGER.debug(f"Fetching device at: {ip_addr}:{port}, data sent: {json_data})")
+class GreeRequestPreempted(Exception):
+    """A queued background request was dropped in favour of a user command."""
 
-    timeout = 2
 
-    for attempt in range(max_retries):
-        clientSock = None
-        try:
-            clientSock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            clientSock.settimeout(timeout)
+class RequestLimiter:
+    """
+    Cap the number of device requests in flight across the integration.
 
-            # Send data to device
-            clientSock.sendto(bytes(json_data, "utf-8"), (ip_addr, port))
+    Every request holds an executor thread while it waits for the answer,
+    so bursts (YAML import, mass automations) would otherwise exhaust HA's
+    executor. Taken after the per-host slot, so requests queued behind a
+    busy unit don't hold a global slot.
+    """
 
-            # Receive response with event loop yielding
-            data, _ = await asyncio.wait_for(asyncio.get_event_loop().run_in_executor(None, clientSock.recvfrom, 64000), timeout=timeout)
+    def __init__(self, max_in_flight):
+        self.max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiters = deque()
 
-            # Parse and decrypt response
-            received_json = simplejson.loads(data)
-            pack = received_json["pack"]
-            decoded_pack = base64.b64decode(pack)
-            decrypted_pack = cipher.decrypt(decoded_pack)
+    def queue_depth(self, host=None):
+        """Return the number of requests waiting for a slot, to host or to any host."""
+        return sum(1 for future, waiting_host in self._waiters if not future.done() and host in (None, waiting_host))
 
-            if encryption_version == 2:
-                tag = received_json["tag"]
-                cipher.verify(base64.b64decode(tag))
+    @asynccontextmanager
+    async def slot(self, host=None):
+        if self._in_flight < self.max_in_flight and not self.queue_depth():
+            self._in_flight += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append((future, host))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over just as we were cancelled
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
 
-            # Clean up response data
-            decoded_text = decrypted_pack.decode("utf-8")
-            # Remove null bytes and trailing data after last }
-            clean_text = decoded_text.replace("\x0f", "")
-            last_brace = clean_text.rindex("}")
-            clean_text = clean_text[: last_brace + 1]
+    def _release(self):
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.max_in_flight:
+            future, _ = self._waiters.popleft()
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
 
-            result = simplejson.loads(clean_text)
 
-            _LOGGER.debug(f"Successfully received response on attempt {attempt + 1}")
-            return result
+class HostRequestScheduler:
+    """
+    Hand out request slots for one host, interactive requests first.
 
-        except Exception as e:
-            if attempt == max_retries - 1:
-                error_msg = f"{type(e).__name__}: {str(e)}" if str(e) else f"{type(e).__name__}"
-                _LOGGER.error(f"All {max_retries} attempts failed for {ip_addr}:{port}. Error: {error_msg}")
-                raise
+    Gree Wi-Fi modules handle one request at a time, so requests to the same
+    host are queued. Interactive requests are served before background ones
+    and drop preemptible background requests that are still waiting to be
+    sent; a poll issued right before a command would be stale anyway.
+    """
 
+    def __init__(self, host, limiter, max_in_flight=DEFAULT_MAX_REQUESTS_PER_HOST):
+        self.host = host
+        # The integration-wide limiter, taken after our slot
+        self.limiter = limiter
+        self.max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiters = {PRIORITY_INTERACTIVE: deque(), PRIORITY_BACKGROUND: deque()}
+        # Time requests spent waiting for the host and the global slot
+        self.average_wait = None
+        # Recent round trip times, to decide when a hedged request is resent
+        self._rtts = deque(maxlen=HEDGE_RTT_SAMPLES)
+
+    def record_wait(self, wait):
+        # Exponential moving average, in seconds
+        self.average_wait = wait if self.average_wait is None else self.average_wait + 0.2 * (wait - self.average_wait)
+
+    def record_rtt(self, rtt):
+        self._rtts.append(rtt)
+
+    def hedge_delay(self, timeout):
+        """Return after how long to resend an unanswered request, None while the host's p95 RTT isn't known."""
+        if len(self._rtts) < HEDGE_MIN_SAMPLES:
+            return None
+        rtts = sorted(self._rtts)
+        delay = max(rtts[min(len(rtts) - 1, int(len(rtts) * 0.95))], HEDGE_MIN_DELAY)
+        # Hedging this late gains little over the regular retry
+        return delay if delay < timeout / 2 else None
+
+    @property
+    def queue_depth(self):
+        """Requests waiting for this host, including those waiting for the integration-wide limit."""
+        return sum(1 for queue in self._waiters.values() for future, _ in queue if not future.done()) + self.limiter.queue_depth(self.host)
+
+    @asynccontextmanager
+    async def slot(self, priority, preemptible=False):
+        await self._async_acquire(priority, preemptible)
+        try:
+            yield
         finally:
-            if clientSock:
+            self._release()
+
+    async def _async_acquire(self, priority, preemptible):
+        if priority == PRIORITY_INTERACTIVE:
+            self._preempt_background()
+
+        if self._in_flight < self.max_in_flight and not self._has_waiters(priority):
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append((future, preemptible))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we were cancelled
+                self._release()
+            raise
+
+    def _has_waiters(self, priority):
+        return any(not future.done() for level in self._waiters if level <= priority for future, _ in self._waiters[level])
+
+    def _preempt_background(self):
+        kept = deque()
+        for future, preemptible in self._waiters[PRIORITY_BACKGROUND]:
+            if future.done():
+                continue
+            if preemptible:
+                future.set_exception(GreeRequestPreempted(f"Background request to {self.host} preempted by a command"))
+            else:
+                kept.append((future, preemptible))
+        self._waiters[PRIORITY_BACKGROUND] = kept
+
+    def _release(self):
+        self._in_flight -= 1
+        for priority in (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND):
+            queue = self._waiters[priority]
+            while queue and self._in_flight < self.max_in_flight:
+                future, _ = queue.popleft()
+                if future.done():
+                    continue
+                self._in_flight += 1
+                future.set_result(None)
+
+
+class GreeNetworkDown(Exception):
+    """The network of a device is considered down; the request was not sent."""
+
+
+class GreeRequestNotSent(asyncio.TimeoutError):
+    """The time budget ran out while the request was still waiting for a slot."""
+
+
+class SubnetHealth:
+    """
+    Notice correlated failures of the units on one /24, which usually share
+    an access point or VLAN.
+
+    Once SUBNET_OUTAGE_HOSTS different hosts have run out of retries within
+    SUBNET_OUTAGE_WINDOW, and no unit on the subnet answered in that window,
+    the subnet is marked down. Requests to hosts whose last request failed
+    then fail immediately, except a single one-attempt probe per backoff
+    period; hosts that last answered or weren't asked yet are still asked
+    normally. The first answer from any unit clears the outage.
+    """
+
+    def __init__(self, subnet):
+        self.subnet = subnet
+        # Host -> time of its last failed request, since the last answer from the subnet
+        self._failed_hosts = {}
+        # Host -> whether its last request was answered
+        self._answered = {}
+        self._last_success = None
+        self.down = False
+        self._probing = False
+        self._next_probe = 0.0
+        self._probe_interval = SUBNET_PROBE_INTERVAL
+
+    def fails_fast(self, host):
+        """Return whether requests to host are held back by an outage."""
+        # Hosts not asked yet (a unit being added) get to send
+        return self.down and self._answered.get(host) is False
+
+    def start_probe(self):
+        """Return whether the caller may send the probe for a subnet that is down."""
+        if self._probing or time.monotonic() < self._next_probe:
+            return False
+        self._probing = True
+        return True
+
+    def end_probe(self):
+        self._probing = False
+
+    def record_success(self, host):
+        if self.down:
+            _LOGGER.info(f"Network {self.subnet} is answering again, resuming requests")
+        self._answered[host] = True
+        self._last_success = time.monotonic()
+        self._failed_hosts.clear()
+        self.down = False
+        self._probe_interval = SUBNET_PROBE_INTERVAL
+
+    def record_failure(self, host, probe=False):
+        now = time.monotonic()
+        self._answered[host] = False
+        if self.down:
+            if probe:
+                # The probe failed, wait longer for the next one
+                self._probe_interval = min(self._probe_interval * 2, SUBNET_PROBE_INTERVAL_MAX)
+                self._next_probe = now + self._probe_interval
+            return
+        self._failed_hosts[host] = now
+        self._failed_hosts = {failed: at for failed, at in self._failed_hosts.items() if now - at <= SUBNET_OUTAGE_WINDOW}
+        if len(self._failed_hosts) < SUBNET_OUTAGE_HOSTS:
+            return
+        if self._last_success is not None and now - self._last_success <= SUBNET_OUTAGE_WINDOW:
+            # Some unit answered recently, these hosts are more likely unplugged than the network down
+            return
+        _LOGGER.warning(f"No unit on network {self.subnet} is answering ({len(self._failed_hosts)} failed), probing every {self._probe_interval}s until one does")
+        self.down = True
+        self._next_probe = now + self._probe_interval
+
+
+class GreeTransport:
+    """
+    Request state shared by all devices of one Home Assistant instance:
+    the request limits, per-host schedulers, subnet outage trackers and
+    the keys handed out by bind.
+    """
+
+    def __init__(self):
+        self.limiter = RequestLimiter(DEFAULT_MAX_REQUESTS_IN_FLIGHT)
+        self.max_requests_per_host = DEFAULT_MAX_REQUESTS_PER_HOST
+        self.host_schedulers: dict[str, HostRequestScheduler] = {}
+        self.subnet_health: dict[str, SubnetHealth] = {}
+        # Keys per (gateway MAC, encryption version); sub-units share their gateway's key
+        self.bind_keys: dict[tuple[str, int], bytes] = {}
+        self.bind_flights = SingleFlight()
+
+
+def get_transport(hass) -> GreeTransport:
+    """Return the request state shared by all devices."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if "_transport" not in data:
+        data["_transport"] = GreeTransport()
+    return data["_transport"]
+
+
+def get_host_scheduler(hass, ip_addr):
+    """Return the request scheduler shared by all devices behind ip_addr."""
+    transport = get_transport(hass)
+    scheduler = transport.host_schedulers.get(ip_addr)
+    if scheduler is None:
+        scheduler = transport.host_schedulers[ip_addr] = HostRequestScheduler(ip_addr, transport.limiter, transport.max_requests_per_host)
+    return scheduler
+
+
+def configure_request_limits(hass, max_in_flight=None, max_per_host=None):
+    """Change the global and per-host request limits; queued requests follow the new limits as slots free up."""
+    transport = get_transport(hass)
+    if max_in_flight is not None:
+        transport.limiter.max_in_flight = max_in_flight
+    if max_per_host is not None:
+        transport.max_requests_per_host = max_per_host
+        for scheduler in transport.host_schedulers.values():
+            scheduler.max_in_flight = max_per_host
+
+
+def get_subnet_health(hass, ip_addr):
+    """Return the outage tracker shared by all devices on the /24 of ip_addr."""
+    try:
+        subnet = str(ipaddress.ip_network(f"{ip_addr}/24", strict=False))
+    except ValueError:
+        # Host names can't be grouped
+        subnet = ip_addr
+    subnet_health = get_transport(hass).subnet_health
+    health = subnet_health.get(subnet)
+    if health is None:
+        health = subnet_health[subnet] = SubnetHealth(subnet)
+    return health
+
+
+async def FetchResult(hass, cipher, ip_addr, port, json_data, encryption_version=1, budget=REQUEST_BUDGET_DEFAULT, priority=PRIORITY_INTERACTIVE, hedge=False):
+    """
+    Send a request to a Gree device and fetch the result, retrying until it
+    succeeds or its time budget (seconds, including time queued for a slot)
+    runs out. While the network of the device is down, fail fast instead,
+    except for a periodic single-attempt probe. With hedge, an unanswered
+    request is sent again once the host's p95 round trip time has passed.
+    """
+    health = get_subnet_health(hass, ip_addr)
+    probe = health.fails_fast(ip_addr)
+    if probe and not health.start_probe():
+        raise GreeNetworkDown(f"Network {health.subnet} of {ip_addr} is down, waiting for the next probe")
+
+    try:
+        result = await _fetch_result(hass, cipher, ip_addr, port, json_data, encryption_version, min(budget, REQUEST_TIMEOUT) if probe else budget, priority, hedge)
+    except (GreeRequestPreempted, GreeRequestNotSent):
+        # Never reached the network; congestion in our own queues says nothing about it
+        raise
+    except (asyncio.TimeoutError, OSError):
+        health.record_failure(ip_addr, probe)
+        raise
+    except Exception:
+        # The device answered, even if we couldn't use the answer
+        health.record_success(ip_addr)
+        raise
+    else:
+        health.record_success(ip_addr)
+        return result
+    finally:
+        if probe:
+            health.end_probe()
+
+
+async def _fetch_result(hass, cipher, ip_addr, port, json_data, encryption_version, budget, priority, hedge):
+
+    _LOGGER.debug(f"Fetching device at: {ip_addr}:{port}, data sent: {json_data})")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + budget
+    scheduler = get_host_scheduler(hass, ip_addr)
+    attempt = 0
+
+    sent = False
+
+    try:
+        # Hard stop at the deadline, wherever the request is; cancellation propagates unchanged
+        async with asyncio.timeout_at(deadline):
+            while True:
+                clientSock = None
                 try:
-                    clientSock.close()
-                except Exception as e:
-                    _LOGGER.debug(f"Error closing socket: {str(e)}")
+                    started = time.monotonic()
+                    # Only a background request that hasn't been sent yet may be dropped
+                    async with scheduler.slot(priority, preemptible=(priority == PRIORITY_BACKGROUND and attempt == 0)), scheduler.limiter.slot(ip_addr):
+                        scheduler.record_wait(time.monotonic() - started)
+                        timeout = max(min(REQUEST_TIMEOUT, deadline - loop.time()), REQUEST_MIN_ATTEMPT)
+                        clientSock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                        clientSock.settimeout(timeout)
+
+                        # Send data to device
+                        packet = bytes(json_data, "utf-8")
+                        clientSock.sendto(packet, (ip_addr, port))
+                        sent = True
+                        sentAt = time.monotonic()
+
+                        # Receive response with event loop yielding
+                        receive = loop.run_in_executor(None, clientSock.recvfrom, 64000)
+                        hedge_delay = scheduler.hedge_delay(timeout) if hedge else None
+                        hedged = False
+                        if hedge_delay is not None:
+                            done, _ = await asyncio.wait({receive}, timeout=hedge_delay)
+                            if not done:
+                                # Probably lost on the way; the packet is identical, so whichever reply comes first wins
+                                _LOGGER.debug(f"No reply from {ip_addr}:{port} after {hedge_delay * 1000:.0f}ms, sending the request again")
+                                clientSock.sendto(packet, (ip_addr, port))
+                                hedged = True
+                        data, _ = await asyncio.wait_for(receive, timeout=timeout - (time.monotonic() - sentAt))
+                        if not hedged:
+                            # Either packet may have been answered; such a sample would feed the hedge delay into itself
+                            scheduler.record_rtt(time.monotonic() - sentAt)
+
+                    # Parse and decrypt response
+                    received_json = simplejson.loads(data)
+                    pack = received_json["pack"]
+                    decoded_pack = base64.b64decode(pack)
+                    decrypted_pack = cipher.decrypt(decoded_pack)
+
+                    if encryption_version == 2:
+                        tag = received_json["tag"]
+                        cipher.verify(base64.b64decode(tag))
+
+                    # Clean up response data
+                    decoded_text = decrypted_pack.decode("utf-8")
+                    # Remove null bytes and trailing data after last }
+                    clean_text = decoded_text.replace("\x0f", "")
+                    last_brace = clean_text.rindex("}")
+                    clean_text = clean_text[: last_brace + 1]
+
+                    result = simplejson.loads(clean_text)
+
+                    _LOGGER.debug(f"Successfully received response on attempt {attempt + 1}")
+                    return result
+
+                except GreeRequestPreempted:
+                    _LOGGER.debug(f"Background request to {ip_addr}:{port} preempted by a command")
+                    raise
 
-        # Progressive backoff before retry
-        if attempt < max_retries - 1:
-            await asyncio.sleep(0.5 + (attempt * 0.3))  # 0.5s, 0.8s, 1.1s, 1.4s, 1.7s, 2.0s, 2.3s
+                except Exception as e:
+                    # Progressive backoff before retry: 0.5s, 0.8s, 1.1s, ... as long as another attempt fits in the budget
+                    backoff = 0.5 + (attempt * 0.3)
+                    if loop.time() + backoff + REQUEST_MIN_ATTEMPT > deadline:
+                        error_msg = f"{type(e).__name__}: {str(e)}" if str(e) else f"{type(e).__name__}"
+                        _LOGGER.error(f"All {attempt + 1} attempts within {budget}s failed for {ip_addr}:{port}. Error: {error_msg}")
+                        raise
+
+                finally:
+                    if clientSock:
+                        try:
+                            clientSock.close()
+                        except Exception as e:
+                            _LOGGER.debug(f"Error closing socket: {str(e)}")
+
+                await asyncio.sleep(backoff)
+                attempt += 1
+    except asyncio.TimeoutError:
+        if not sent:
+            raise GreeRequestNotSent(f"Request to {ip_addr}:{port} still queued when its {budget}s budget ran out") from None
+        raise
 
 
 def Pad(s):
@@ -207,7 +582,12 @@ def _build_discovery_sockets(
     return sockets
 
 
-async def test_connection(config):
+def normalize_mac(mac_addr):
+    """Return mac_addr as devices report it in discovery: lower case hex without separators."""
+    return mac_addr.replace(":", "").replace("-", "").lower()
+
+
+async def test_connection(hass, config):
     """Test connection to a Gree device."""
 
     ip_addr = config[CONF_HOST]
@@ -215,7 +595,7 @@ async def test_connection(config):
     encryption_version = config[CONF_ENCRYPTION_VERSION]
     encryption_key = config[CONF_ENCRYPTION_KEY]
 
-    mac_addr = config.get(CONF_MAC).encode().replace(b":", b"").replace(b"-", b"").decode("utf-8").lower()
+    mac_addr = normalize_mac(config.get(CONF_MAC))
     if "@" in mac_addr:
         mac_addr = mac_addr.split("@", 1)[1]
 
@@ -223,9 +603,9 @@ async def test_connection(config):
 
     try:
         if encryption_version == 1:
-            key = await GetDeviceKey(mac_addr, ip_addr, port)
+            key = await GetDeviceKey(hass, mac_addr, ip_addr, port, budget=REQUEST_BUDGET_CONFIG_FLOW)
         else:
-            key = await GetDeviceKeyGCM(mac_addr, ip_addr, port)
+            key = await GetDeviceKeyGCM(hass, mac_addr, ip_addr, port, budget=REQUEST_BUDGET_CONFIG_FLOW)
         _LOGGER.debug(f"test_connection: Got device key: {key}")
         return key is not None
     except Exception as e:
@@ -233,15 +613,18 @@ async def test_connection(config):
         return False
 
 
-async def GetDeviceKey(mac_addr, ip_addr, port, max_retries=8):
+async def GetDeviceKey(hass, mac_addr, ip_addr, port, budget=REQUEST_BUDGET_BIND, priority=PRIORITY_INTERACTIVE):
     _LOGGER.debug("Retrieving HVAC encryption key")
     cipher = AES.new(GENERIC_GREE_DEVICE_KEY.encode("utf8"), AES.MODE_ECB)
     pack = base64.b64encode(cipher.encrypt(Pad(f'{{"mac":"{mac_addr}","t":"bind","uid":0}}').encode("utf8"))).decode("utf-8")
     jsonPayloadToSend = f'{{"cid": "app","i": 1,"pack": "{pack}","t":"pack","tcid":"{mac_addr}","uid": 0}}'
     try:
-        result = await FetchResult(cipher, ip_addr, port, jsonPayloadToSend, max_retries=max_retries)
+        result = await FetchResult(hass, cipher, ip_addr, port, jsonPayloadToSend, budget=budget, priority=priority)
         _LOGGER.debug(f"GetDeviceKey: FetchResult: {result}")
         key = result["key"].encode("utf8")
+    except (GreeRequestPreempted, GreeRequestNotSent):
+        # Not a failure, the caller binds again later
+        raise
     except Exception:
         _LOGGER.debug("Error getting device encryption key!")
         return None
@@ -264,15 +647,18 @@ def EncryptGCM(key, plaintext):
     return (pack, tag)
 
 
-async def GetDeviceKeyGCM(mac_addr, ip_addr, port, max_retries=8):
+async def GetDeviceKeyGCM(hass, mac_addr, ip_addr, port, budget=REQUEST_BUDGET_BIND, priority=PRIORITY_INTERACTIVE):
     _LOGGER.debug("Retrieving HVAC encryption key (GCM)")
     plaintext = f'{{"cid":"{mac_addr}", "mac":"{mac_addr}","t":"bind","uid":0}}'
     pack, tag = EncryptGCM(GENERIC_GREE_DEVICE_KEY_GCM, plaintext)
     jsonPayloadToSend = f'{{"cid": "app","i": 1,"pack": "{pack}","t":"pack","tcid":"{mac_addr}","uid": 0, "tag" : "{tag}"}}'
     try:
-        result = await FetchResult(GetGCMCipher(GENERIC_GREE_DEVICE_KEY_GCM), ip_addr, port, jsonPayloadToSend, encryption_version=2, max_retries=max_retries)
+        result = await FetchResult(hass, GetGCMCipher(GENERIC_GREE_DEVICE_KEY_GCM), ip_addr, port, jsonPayloadToSend, encryption_version=2, budget=budget, priority=priority)
         _LOGGER.debug(f"GetDeviceKeyGCM: FetchResult: {result}")
         key = result["key"].encode("utf8")
+    except (GreeRequestPreempted, GreeRequestNotSent):
+        # Not a failure, the caller binds again later
+        raise
     except Exception:
         _LOGGER.debug("Error getting device encryption key!")
         return None
@@ -471,7 +857,7 @@ async def discover_gree_devices(hass, timeout=5, extra_networks=None, extra_host
                                 if sub_cnt > 1:
                                     try:
                                         _LOGGER.debug(f"Fetching sub-devices for {mac_addr} (subCnt={sub_cnt})")
-                                        sub_devices = await get_subunits_list(mac_addr, addr[0], BROADCAST_PORT)
+                                        sub_devices = await get_subunits_list(hass, mac_addr, addr[0], BROADCAST_PORT)
                                         for sub_device in sub_devices.get("list", []):
                                             sub_mac = sub_device.get("mac", "")
                                             if sub_mac:
@@ -514,16 +900,59 @@ async def discover_gree_devices(hass, timeout=5, extra_networks=None, extra_host
     return devices
 
 
-async def detect_device_encryption(mac_addr, ip_addr, port):
+def _bind_cache_key(mac_addr, encryption_version):
+    return (str(mac_addr).replace(":", "").lower(), encryption_version)
+
+
+async def async_get_bind_key(hass, mac_addr, ip_addr, port, encryption_version, budget=REQUEST_BUDGET_BIND, priority=PRIORITY_INTERACTIVE):
+    """
+    Return the device key of the gateway with mac_addr. The bind handshake
+    runs once for all its sub-units and for discovery; concurrent callers
+    share the handshake in flight.
+    """
+    transport = get_transport(hass)
+    cache_key = _bind_cache_key(mac_addr, encryption_version)
+    key = transport.bind_keys.get(cache_key)
+    if key is not None:
+        _LOGGER.debug(f"Using cached encryption key for {cache_key[0]} (version {encryption_version})")
+        return key
+
+    bind = GetDeviceKey if encryption_version == 1 else GetDeviceKeyGCM
+    # Interactive callers never join a background bind that could be preempted
+    key = await transport.bind_flights.async_run((cache_key, priority), lambda: bind(hass, mac_addr, ip_addr, port, budget=budget, priority=priority))
+    if key:
+        transport.bind_keys[cache_key] = key
+    return key
+
+
+def get_cached_bind_key(hass, mac_addr, encryption_version):
+    """Return the key of an earlier bind, without contacting the device."""
+    if "@" in mac_addr:
+        mac_addr = mac_addr.split("@", 1)[1]
+    return get_transport(hass).bind_keys.get(_bind_cache_key(mac_addr, encryption_version))
+
+
+def forget_bind_key(hass, mac_addr, encryption_version):
+    """Drop a cached key, so the next caller binds again."""
+    get_transport(hass).bind_keys.pop(_bind_cache_key(mac_addr, encryption_version), None)
+
+
+async def detect_device_encryption(hass, mac_addr, ip_addr, port):
     """Test which encryption version a device uses for communication."""
     if "@" in mac_addr:
         mac_addr = mac_addr.split("@", 1)[1]
     _LOGGER.debug(f"Detecting encryption version for device {mac_addr} at {ip_addr}:{port}")
 
+    # A gateway we already bound to needs no further handshakes
+    for encryption_version in (1, 2):
+        if _bind_cache_key(mac_addr, encryption_version) in get_transport(hass).bind_keys:
+            _LOGGER.debug(f"Device {mac_addr} uses encryption version {encryption_version} (cached)")
+            return encryption_version
+
     # Test encryption version 1 first
     try:
         _LOGGER.debug(f"Testing encryption version 1 for device {mac_addr}")
-        key = await GetDeviceKey(mac_addr, ip_addr, port, max_retries=1)
+        key = await async_get_bind_key(hass, mac_addr, ip_addr, port, 1, budget=REQUEST_TIMEOUT)
         if key:
             _LOGGER.debug(f"Device {mac_addr} uses encryption version 1")
             return 1
@@ -533,7 +962,7 @@ async def detect_device_encryption(mac_addr, ip_addr, port):
     # Test encryption version 2
     try:
         _LOGGER.debug(f"Testing encryption version 2 for device {mac_addr}")
-        key = await GetDeviceKeyGCM(mac_addr, ip_addr, port, max_retries=1)
+        key = await async_get_bind_key(hass, mac_addr, ip_addr, port, 2, budget=REQUEST_TIMEOUT)
         if key:
             _LOGGER.debug(f"Device {mac_addr} uses encryption version 2")
             return 2
@@ -543,13 +972,13 @@ async def detect_device_encryption(mac_addr, ip_addr, port):
     _LOGGER.error(f"Could not determine encryption version for device {mac_addr}")
     return None
 
-async def get_subunits_list(mac_addr, ip_addr, port):
+async def get_subunits_list(hass, mac_addr, ip_addr, port):
     """
     Fetch the list of sub-devices for a Gree device.
     """
     try:
         # Prepare the payload
-        encryption_version = await detect_device_encryption(mac_addr, ip_addr, port)
+        encryption_version = await detect_device_encryption(hass, mac_addr, ip_addr, port)
 
         json_payload = f'{{"mac":"{mac_addr}", "i":"1"}}'
         if encryption_version == 1:
@@ -563,7 +992,7 @@ async def get_subunits_list(mac_addr, ip_addr, port):
             f'{{"cid": "app","i": 1,"pack": "{pack}","t":"subList","tcid":"{str(mac_addr)}","uid": 0}}'
         )
         # Use FetchResult to send and receive data
-        result = await FetchResult(cipher, ip_addr, port, jsonPayloadToSend, encryption_version=encryption_version)
+        result = await FetchResult(hass, cipher, ip_addr, port, jsonPayloadToSend, encryption_version=encryption_version, budget=REQUEST_BUDGET_CONFIG_FLOW)
         _LOGGER.debug(f"get_subunits_list: FetchResult: {result}")
 
         return result
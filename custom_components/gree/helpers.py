@@ -1,6 +1,82 @@
 """Helper functions and classes for Gree integration."""
 
-from .const import TEMSEN_OFFSET
+# Standard library imports
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+from typing import Any
+
+# Home Assistant imports
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.helpers.storage import Store
+
+# Local imports
+from .const import (
+    DOMAIN,
+    POLL_FAST_WINDOW,
+    POLL_IDLE_AFTER,
+    POLL_INTERVAL_FAST,
+    POLL_INTERVAL_IDLE,
+    POLL_INTERVAL_NORMAL,
+    POLL_INTERVAL_OFFLINE_MAX,
+    STARTUP_JITTER,
+    STARTUP_MAX_CONCURRENT,
+    STATUS_COLUMNS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TEMSEN_OFFSET,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Position of every status column in DeviceState, computed once
+STATUS_COLUMN_INDEX = {column: index for index, column in enumerate(STATUS_COLUMNS)}
+
+
+class DeviceState:
+    """
+    Fixed-layout store for the status columns of one device.
+
+    Values live in a list indexed by precomputed column positions, so a
+    status vector is applied in one pass. Offers the dict-style access
+    (get, [], update) that entities use on _acOptions.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self):
+        self._values = [None] * len(STATUS_COLUMNS)
+
+    def __getitem__(self, column: str) -> Any:
+        return self._values[STATUS_COLUMN_INDEX[column]]
+
+    def __setitem__(self, column: str, value: Any) -> None:
+        self._values[STATUS_COLUMN_INDEX[column]] = value
+
+    def get(self, column: str, default: Any = None) -> Any:
+        index = STATUS_COLUMN_INDEX.get(column)
+        return default if index is None else self._values[index]
+
+    def update(self, options: dict) -> None:
+        for column, value in options.items():
+            self._values[STATUS_COLUMN_INDEX[column]] = value
+
+    def items(self):
+        return zip(STATUS_COLUMNS, self._values)
+
+    def apply(self, columns, values) -> list[str]:
+        """Store a status vector for columns and return the columns whose value changed."""
+        stored = self._values
+        changed = []
+        for column, value in zip(columns, values):
+            index = STATUS_COLUMN_INDEX[column]
+            if stored[index] != value:
+                stored[index] = value
+                changed.append(column)
+        return changed
 
 
 class TempOffsetResolver:
@@ -63,6 +139,231 @@ class TempOffsetResolver:
         return pen
 
 
+class CommandCoalescer:
+    """
+    Merge option changes submitted within a short window into one call.
+
+    The first submission opens the window; everything submitted before it
+    closes is merged (later values win) and handed to the flush callback
+    once. Every caller awaiting async_submit() gets the shared result.
+    """
+
+    def __init__(self, hass, window: float, flush: Callable[[dict], Awaitable[Any]]):
+        self._hass = hass
+        self.window = window
+        self._flush = flush
+        self._pending: dict = {}
+        self._future: asyncio.Future | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def async_submit(self, options: dict) -> Any:
+        self._pending.update(options)
+        if self._future is None:
+            loop = asyncio.get_running_loop()
+            self._future = loop.create_future()
+            self._handle = loop.call_later(self.window, self._start_flush)
+        # Shield so one cancelled caller doesn't cancel the merged command
+        return await asyncio.shield(self._future)
+
+    def cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._future is not None and not self._future.done():
+            self._future.cancel()
+        self._future = None
+        self._pending = {}
+        for flush in self._flushes:
+            flush.cancel()
+
+    def _start_flush(self) -> None:
+        options, self._pending = self._pending, {}
+        future, self._future = self._future, None
+        self._handle = None
+        flush = self._hass.async_create_task(self._async_flush(options, future))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _async_flush(self, options: dict, future: asyncio.Future) -> None:
+        try:
+            result = await self._flush(options)
+        except asyncio.CancelledError:
+            # Don't leave the callers waiting for a command that won't complete
+            if not future.done():
+                future.cancel()
+            raise
+        except Exception as ex:
+            if not future.done():
+                future.set_exception(ex)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key starts the call; callers arriving while it
+    is still running await the same result (or exception).
+    """
+
+    def __init__(self):
+        self._flights: dict[Hashable, asyncio.Future] = {}
+
+    async def async_run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._async_call(key, call))
+            self._flights[key] = flight
+        return await asyncio.shield(flight)
+
+    async def _async_call(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await call()
+        finally:
+            self._flights.pop(key, None)
+
+
+class AdaptivePollPolicy:
+    """
+    Pick the delay until the next status poll from recent device activity.
+
+    Polls fast for a short window after a command or an observed mode
+    change so the UI catches up with the unit, slowly while the unit is off
+    or nothing has changed for a while, and backs off exponentially while
+    the unit does not answer.
+    """
+
+    def __init__(
+        self,
+        fast: float = POLL_INTERVAL_FAST,
+        normal: float = POLL_INTERVAL_NORMAL,
+        idle: float = POLL_INTERVAL_IDLE,
+        offline_max: float = POLL_INTERVAL_OFFLINE_MAX,
+        fast_window: float = POLL_FAST_WINDOW,
+        idle_after: float = POLL_IDLE_AFTER,
+    ):
+        self._fast = fast
+        self._normal = normal
+        self._idle = idle
+        self._offline_max = offline_max
+        self._fast_window = fast_window
+        self._idle_after = idle_after
+
+        self._last_activity: float | None = None
+        self._last_change = time.monotonic()
+        self._failures = 0
+
+    def record_activity(self) -> None:
+        """A command was sent or the unit changed mode."""
+        self._last_activity = self._last_change = time.monotonic()
+
+    def record_success(self, changed: bool) -> None:
+        self._failures = 0
+        if changed:
+            self._last_change = time.monotonic()
+
+    def record_failure(self) -> None:
+        self._failures += 1
+
+    def next_interval(self, powered_on: bool) -> float:
+        now = time.monotonic()
+        if self._failures:
+            return min(self._normal * 2 ** (self._failures - 1), self._offline_max)
+        if self._last_activity is not None and now - self._last_activity < self._fast_window:
+            return self._fast
+        if not powered_on or now - self._last_change > self._idle_after:
+            return self._idle
+        return self._normal
+
+
+class StartupScheduler:
+    """
+    Stagger the first contact (the key bind) of every device so a large
+    fleet doesn't burst the network at once.
+
+    Each device waits a random delay of up to the jitter, then for one of
+    max_concurrent slots, which it holds only for the bind handshake.
+    """
+
+    def __init__(self, max_concurrent: int = STARTUP_MAX_CONCURRENT, jitter: float = STARTUP_JITTER):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._jitter = jitter
+
+    @asynccontextmanager
+    async def slot(self, jitter: bool = True):
+        if jitter:
+            await asyncio.sleep(random.uniform(0, self._jitter))
+        async with self._semaphore:
+            yield
+
+
+def get_startup_scheduler(hass) -> StartupScheduler:
+    """Return the startup scheduler shared by all devices."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault("_startup_scheduler", StartupScheduler())
+
+
+class DeviceStateStore:
+    """
+    Last confirmed state of every device, keyed by unique ID.
+
+    Kept in memory and written to disk with a delay, so frequent updates
+    cost one write per STORAGE_SAVE_DELAY. Pending data is also written
+    when Home Assistant shuts down.
+    """
+
+    def __init__(self, hass):
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.device_state")
+        self._data: dict[str, dict] = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    def get(self, key: str) -> dict | None:
+        return self._data.get(key)
+
+    def async_save(self, key: str, state: dict) -> None:
+        self._data[key] = state
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+    def async_remove(self, key: str) -> None:
+        if self._data.pop(key, None) is not None:
+            self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+
+async def async_get_device_state_store(hass) -> DeviceStateStore:
+    """Return the state store shared by all devices, loading it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if "_state_store" not in data:
+        data["_state_store"] = hass.async_create_task(_async_load_device_state_store(hass))
+    return await data["_state_store"]
+
+
+async def _async_load_device_state_store(hass) -> DeviceStateStore:
+    store = DeviceStateStore(hass)
+    await store.async_load()
+    return store
+
+
+async def async_run_import_flows(hass, configs: list[dict], concurrency: int) -> None:
+    """Run an import flow per device config through a few workers, so a batch doesn't bind every unit at once."""
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    for config in configs:
+        queue.put_nowait(config)
+
+    async def worker() -> None:
+        while not queue.empty():
+            config = queue.get_nowait()
+            try:
+                await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_IMPORT}, data=config)
+            except Exception:
+                _LOGGER.exception("Failed to import device %s", config.get("name"))
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(configs)))))
+
+
 def gree_f_to_c(desired_temp_f):
     # Convert to fractional C values for AC
     # See: https://github.com/tomikaa87/gree-remote
@@ -21,7 +21,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 # Local imports
 from .const import DEFAULT_TARGET_TEMP_STEP
-from .entity import GreeEntity, GreeEntityDescription
+from .entity import GreeEntity, GreeEntityDescription, async_setup_device_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +32,13 @@ class GreeNumberEntityDescription(GreeEntityDescription, NumberEntityDescription
     restore_state: bool = False
 
 
+def _set_target_temperature_step(device, value: float) -> None:
+    device._target_temperature_step = value
+    # The step is a climate attribute, not a status column, so nothing else writes the climate state for it
+    if device.entity_id is not None:
+        device.async_write_ha_state()
+
+
 NUMBERS: tuple[GreeNumberEntityDescription, ...] = (
     GreeNumberEntityDescription(
         property_key="target_temp_step",
@@ -41,7 +48,7 @@ NUMBERS: tuple[GreeNumberEntityDescription, ...] = (
         native_step=0.1,
         mode=NumberMode.SLIDER,
         value_fn=lambda device: getattr(device, "_target_temperature_step", DEFAULT_TARGET_TEMP_STEP),
-        set_fn=lambda device, value: setattr(device, "_target_temperature_step", value),
+        set_fn=_set_target_temperature_step,
         entity_category=EntityCategory.CONFIG,
         restore_state=True,
     ),
@@ -54,7 +61,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Gree number entities based on a config entry."""
-    async_add_entities(GreeNumberEntity(hass, entry, description) for description in NUMBERS)
+    async_setup_device_entities(hass, entry, async_add_entities, lambda device: [GreeNumberEntity(hass, entry, description, device) for description in NUMBERS])
 
 
 class GreeNumberEntity(GreeEntity, NumberEntity, RestoreEntity):
@@ -62,8 +69,8 @@ class GreeNumberEntity(GreeEntity, NumberEntity, RestoreEntity):
 
     entity_description: GreeNumberEntityDescription
 
-    def __init__(self, hass, entry, description: GreeNumberEntityDescription) -> None:
-        super().__init__(hass, entry, description)
+    def __init__(self, hass, entry, description: GreeNumberEntityDescription, device=None) -> None:
+        super().__init__(hass, entry, description, device)
         self._attr_native_value = self.native_value
         self._restored = False
 
@@ -76,7 +83,8 @@ class GreeNumberEntity(GreeEntity, NumberEntity, RestoreEntity):
                     value = float(last_state.state)
                     # Validate the value is within the entity's range
                     if self.entity_description.native_min_value <= value <= self.entity_description.native_max_value:
-                        setattr(self._device, f"_{self.entity_description.property_key}", value)
+                        if self.entity_description.set_fn:
+                            self.entity_description.set_fn(self._device, value)
                         self._attr_native_value = value
                         self._restored = True
                 except (ValueError, TypeError):
@@ -91,7 +99,8 @@ class GreeNumberEntity(GreeEntity, NumberEntity, RestoreEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         if self.entity_description.set_fn:
-            await self.hass.async_add_executor_job(self.entity_description.set_fn, self._device, value)
+            # Runs in the event loop, set_fn may write the climate state
+            self.entity_description.set_fn(self._device, value)
         if self.entity_description.restore_state:
             self._attr_native_value = value
         self.async_write_ha_state()
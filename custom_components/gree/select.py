@@ -13,13 +13,16 @@ from homeassistant.components.select import (
     SelectEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 # Local imports
-from .entity import GreeEntity, GreeEntityDescription
+from .const import DOMAIN
+from .entity import GreeEntity, GreeEntityDescription, async_setup_device_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,25 +33,110 @@ class GreeSelectEntityDescription(GreeEntityDescription, SelectEntityDescription
 
     set_fn: Callable[[object, str], None] = None
     restore_state: bool = False
-    options_fn: Callable[[object], list[str]] = None
+    options_index_fn: Callable[[HomeAssistant], TemperatureSensorIndex] = None
 
 
-def get_temperature_sensor_options(hass: HomeAssistant) -> list[str]:
-    """Get list of available temperature sensor entities."""
-    options = ["None"]  # Always include "None" as first option
+def _is_temperature_sensor(state: State) -> bool:
+    """Return if a state belongs to a temperature sensor."""
+    if not state.entity_id.startswith("sensor."):
+        return False
+    # Check for explicit device_class
+    if state.attributes.get("device_class") == "temperature":
+        return True
+    # Also check for temperature units as fallback for helpers/combined sensors
+    return state.attributes.get("unit_of_measurement") in ["°C", "°F", "K"]
 
-    # Get all entities from the registry
-    for state in hass.states.async_all():
-        # Look for temperature sensors
-        if state.entity_id.startswith("sensor."):
-            # Check for explicit device_class
-            if state.attributes.get("device_class") == "temperature":
-                options.append(state.entity_id)
-            # Also check for temperature units as fallback for helpers/combined sensors
-            elif state.attributes.get("unit_of_measurement") in ["°C", "°F", "K"]:
-                options.append(state.entity_id)
 
-    return options
+class TemperatureSensorIndex:
+    """
+    Temperature sensor entity IDs, shared by all select entities. Kept current
+    from state changes and entity registry events instead of rescanning every
+    state; listeners are only called when the set itself changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._entity_ids: set[str] = set()
+        self.options: list[str] = ["None"]
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        for state in self._hass.states.async_all("sensor"):
+            if _is_temperature_sensor(state):
+                self._entity_ids.add(state.entity_id)
+        self._rebuild()
+        self._unsubs.append(self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed))
+        self._unsubs.append(self._hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated))
+
+    @callback
+    def async_stop(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call update_callback when the options change. Returns a callback that removes it."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+            if not self._listeners:
+                self.async_stop()
+                self._hass.data.get(DOMAIN, {}).pop("_temperature_sensors", None)
+
+        return remove_listener
+
+    def _rebuild(self) -> None:
+        self.options = ["None", *sorted(self._entity_ids)]
+
+    @callback
+    def _async_changed(self) -> None:
+        self._rebuild()
+        _LOGGER.debug("Updated temperature sensor options: %s", self.options)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _async_state_changed(self, event) -> None:
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith("sensor."):
+            return
+        new_state = event.data.get("new_state")
+        if new_state is not None and _is_temperature_sensor(new_state):
+            if entity_id in self._entity_ids:
+                return
+            self._entity_ids.add(entity_id)
+        elif entity_id in self._entity_ids:
+            self._entity_ids.discard(entity_id)
+        else:
+            return
+        self._async_changed()
+
+    @callback
+    def _async_registry_updated(self, event) -> None:
+        # Removed or renamed entities; new IDs show up through their state
+        if event.data["action"] == "remove":
+            old_entity_id = event.data["entity_id"]
+        else:
+            old_entity_id = event.data.get("old_entity_id")
+        if old_entity_id in self._entity_ids:
+            self._entity_ids.discard(old_entity_id)
+            self._async_changed()
+
+
+@callback
+def async_get_temperature_sensor_index(hass: HomeAssistant) -> TemperatureSensorIndex:
+    """Return the temperature sensor index shared by all Gree devices."""
+    store = hass.data.setdefault(DOMAIN, {})
+    index = store.get("_temperature_sensors")
+    if index is None:
+        index = store["_temperature_sensors"] = TemperatureSensorIndex(hass)
+        index.async_start()
+    return index
 
 
 SELECTS: tuple[GreeSelectEntityDescription, ...] = (
@@ -57,10 +145,10 @@ SELECTS: tuple[GreeSelectEntityDescription, ...] = (
         icon="mdi:thermometer-lines",
         options=[],  # Will be populated dynamically
         value_fn=lambda device: getattr(device, "_external_temperature_sensor", "None"),
-        set_fn=lambda device, value: setattr(device, "_external_temperature_sensor", None if value == "None" else value),
+        set_fn=lambda device, value: device.async_set_external_temperature_sensor(None if value == "None" else value),
         entity_category=EntityCategory.CONFIG,
         restore_state=True,
-        options_fn=lambda hass: get_temperature_sensor_options(hass),
+        options_index_fn=async_get_temperature_sensor_index,
     ),
 )
 
@@ -71,7 +159,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Gree select entities based on a config entry."""
-    async_add_entities(GreeSelectEntity(hass, entry, description) for description in SELECTS)
+    async_setup_device_entities(hass, entry, async_add_entities, lambda device: [GreeSelectEntity(hass, entry, description, device) for description in SELECTS])
 
 
 class GreeSelectEntity(GreeEntity, SelectEntity, RestoreEntity):
@@ -79,24 +167,22 @@ class GreeSelectEntity(GreeEntity, SelectEntity, RestoreEntity):
 
     entity_description: GreeSelectEntityDescription
 
-    def __init__(self, hass: HomeAssistant, entry, description: GreeSelectEntityDescription) -> None:
-        super().__init__(hass, entry, description)
+    def __init__(self, hass: HomeAssistant, entry, description: GreeSelectEntityDescription, device=None) -> None:
+        super().__init__(hass, entry, description, device)
         self._hass = hass
-        # Initialize with no external sensor configured
-        self._device._external_temperature_sensor = None
-        # Set up options dynamically
-        if description.options_fn:
-            self._attr_options = description.options_fn(hass)
-        else:
-            self._attr_options = description.options or ["None"]
+        # Options from an index are filled in once added; a disabled entity never is, and mustn't start the index
+        self._options_index = None
+        self._attr_options = description.options or ["None"]
 
     async def async_added_to_hass(self) -> None:
         """Restore state when entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Refresh options when entity is added
-        if self.entity_description.options_fn:
-            self._attr_options = self.entity_description.options_fn(self._hass)
+        # Follow the sensors added and removed from now on
+        if self.entity_description.options_index_fn:
+            self._options_index = self.entity_description.options_index_fn(self._hass)
+            self._attr_options = self._options_index.options
+            self.async_on_remove(self._options_index.async_add_listener(self._async_options_changed))
 
         # Restore the last selected state if available
         if self.entity_description.restore_state:
@@ -124,14 +210,10 @@ class GreeSelectEntity(GreeEntity, SelectEntity, RestoreEntity):
             self.async_write_ha_state()
             _LOGGER.info("Selected %s: %s", self.entity_description.property_key, option)
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        # Refresh available temperature sensors periodically
-        if self.entity_description.options_fn:
-            new_options = self.entity_description.options_fn(self._hass)
-            if new_options != self._attr_options:
-                self._attr_options = new_options
-                _LOGGER.debug("Updated temperature sensor options: %s", self._attr_options)
+    @callback
+    def _async_options_changed(self) -> None:
+        self._attr_options = self._options_index.options
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
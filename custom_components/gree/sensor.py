@@ -15,12 +15,14 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    UnitOfTime,
 )
+from homeassistant.helpers.entity import EntityCategory
 
 
 # Local imports
-from .const import DOMAIN
-from .entity import GreeEntity, GreeEntityDescription
+from .entity import GreeEntity, GreeEntityDescription, async_setup_device_entities
+from .gree_protocol import get_host_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +41,7 @@ SENSORS: tuple[GreeSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
         value_fn=lambda device: device.outside_temperature if device._has_outside_temp_sensor else None,
+        source_columns=("OutEnvTem",),
         available_fn=lambda device: device.available and device._has_outside_temp_sensor,
     ),
     GreeSensorEntityDescription(
@@ -48,27 +51,47 @@ SENSORS: tuple[GreeSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         suggested_display_precision=0,
         value_fn=lambda device: device.room_humidity if device._has_room_humidity_sensor else None,
+        source_columns=("DwatSen",),
         available_fn=lambda device: device.available and device._has_room_humidity_sensor,
     ),
+    GreeSensorEntityDescription(
+        property_key="request_queue_depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: get_host_scheduler(device.hass, device._ip_addr).queue_depth,
+        polled=True,
+    ),
+    GreeSensorEntityDescription(
+        property_key="request_wait_time",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda device: None if (wait := get_host_scheduler(device.hass, device._ip_addr).average_wait) is None else wait * 1000,
+        polled=True,
+    ),
 )
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up Gree sensors from a config entry."""
-    # Get the device that was created in __init__.py
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    device = entry_data["device"]
-
-    sensors = []
 
-    for description in SENSORS:
-        if description.exists_fn(description, device):
-            sensors.append(GreeSensor(hass, entry, description))
-            _LOGGER.debug(f"Added {description.property_key} sensor")
+    def create_sensors(device):
+        sensors = []
+        for description in SENSORS:
+            if description.exists_fn(description, device):
+                sensors.append(GreeSensor(hass, entry, description, device))
+                _LOGGER.debug(f"Added {description.property_key} sensor")
+        if sensors:
+            _LOGGER.info(f"Added {len(sensors)} Gree sensors")
+        return sensors
 
-    if sensors:
-        async_add_entities(sensors)
-        _LOGGER.info(f"Added {len(sensors)} Gree sensors")
+    async_setup_device_entities(hass, entry, async_add_entities, create_sensors)
 
 
 class GreeSensor(GreeEntity, SensorEntity):
@@ -76,9 +99,9 @@ class GreeSensor(GreeEntity, SensorEntity):
 
     entity_description: GreeSensorEntityDescription
 
-    def __init__(self, hass, entry, description: GreeSensorEntityDescription) -> None:
+    def __init__(self, hass, entry, description: GreeSensorEntityDescription, device=None) -> None:
         """Initialize Gree sensor."""
-        super().__init__(hass, entry, description)
+        super().__init__(hass, entry, description, device)
 
         # Set temperature unit for temperature sensors
         if description.device_class == SensorDeviceClass.TEMPERATURE:
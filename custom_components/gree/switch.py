@@ -22,7 +22,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 # Local imports
-from .entity import GreeEntity, GreeEntityDescription
+from .entity import GreeEntity, GreeEntityDescription, async_setup_device_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,24 +93,28 @@ SWITCHES: tuple[GreeSwitchEntityDescription, ...] = (
         icon="mdi:fan",
         value_fn=lambda device: device._acOptions.get("Blo") == 1,
         set_fn=_set_xfan,
+        source_columns=("Blo",),
     ),
     GreeSwitchEntityDescription(
         property_key="lights",
         icon="mdi:lightbulb",
         value_fn=lambda device: device._acOptions.get("Lig") == 1,
         set_fn=_set_lights,
+        source_columns=("Lig",),
     ),
     GreeSwitchEntityDescription(
         property_key="health",
         icon="mdi:shield-check",
         value_fn=lambda device: device._acOptions.get("Health") == 1,
         set_fn=_set_health,
+        source_columns=("Health",),
     ),
     GreeSwitchEntityDescription(
         property_key="powersave",
         icon="mdi:leaf",
         value_fn=lambda device: device._acOptions.get("SvSt") == 1,
         set_fn=_set_powersave,
+        source_columns=("SvSt", "Pow", "Mod"),
         exists_fn=lambda description, device: HVACMode.COOL in device._hvac_modes,
         available_fn=lambda device: device._hvac_mode == HVACMode.COOL,
     ),
@@ -119,6 +123,7 @@ SWITCHES: tuple[GreeSwitchEntityDescription, ...] = (
         icon="mdi:thermometer-low",
         value_fn=lambda device: device._acOptions.get("StHt") == 1,
         set_fn=_set_eightdegheat,
+        source_columns=("StHt", "Pow", "Mod"),
         exists_fn=lambda description, device: HVACMode.HEAT in device._hvac_modes,
         available_fn=lambda device: device._hvac_mode == HVACMode.HEAT,
     ),
@@ -127,6 +132,7 @@ SWITCHES: tuple[GreeSwitchEntityDescription, ...] = (
         icon="mdi:sleep",
         value_fn=lambda device: device._acOptions.get("SwhSlp") == 1 and device._acOptions.get("SlpMod") == 1,
         set_fn=_set_sleep,
+        source_columns=("SwhSlp", "SlpMod", "Pow", "Mod"),
         available_fn=lambda device: device._hvac_mode in (HVACMode.COOL, HVACMode.HEAT),
     ),
     GreeSwitchEntityDescription(
@@ -134,12 +140,14 @@ SWITCHES: tuple[GreeSwitchEntityDescription, ...] = (
         icon="mdi:air-filter",
         value_fn=lambda device: device._acOptions.get("Air") == 1,
         set_fn=_set_air,
+        source_columns=("Air",),
     ),
     GreeSwitchEntityDescription(
         property_key="anti_direct_blow",
         icon="mdi:weather-windy",
         value_fn=lambda device: device._acOptions.get("AntiDirectBlow") == 1,
         set_fn=_set_anti_direct_blow,
+        source_columns=("AntiDirectBlow",),
         available_fn=lambda device: getattr(device, "_has_anti_direct_blow", False),
     ),
     GreeSwitchEntityDescription(
@@ -147,6 +155,7 @@ SWITCHES: tuple[GreeSwitchEntityDescription, ...] = (
         icon="mdi:lightbulb-on",
         value_fn=lambda device: device._acOptions.get("LigSen") == 0,  # LigSen=0 means sensor is active
         set_fn=_set_light_sensor,
+        source_columns=("LigSen",),
         available_fn=lambda device: getattr(device, "_has_light_sensor", False),
     ),
     # These entities are not kept in the climate device
@@ -182,7 +191,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Gree switch based on a config entry."""
-    async_add_entities(GreeSwitchEntity(hass, entry, description) for description in SWITCHES)
+    async_setup_device_entities(hass, entry, async_add_entities, lambda device: [GreeSwitchEntity(hass, entry, description, device) for description in SWITCHES])
 
 
 class GreeSwitchEntity(GreeEntity, SwitchEntity, RestoreEntity):
@@ -195,8 +204,9 @@ class GreeSwitchEntity(GreeEntity, SwitchEntity, RestoreEntity):
         hass,
         entry,
         description: GreeSwitchEntityDescription,
+        device=None,
     ) -> None:
-        super().__init__(hass, entry, description)
+        super().__init__(hass, entry, description, device)
         self._attr_is_on = bool(self.native_value)
         self._restored = False
 